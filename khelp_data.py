@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+KHELP dashboard data layer shared by both Streamlit apps:
+- Warning and log suppression for Streamlit/Plotly noise
+- CSV dataset table and the shared, mtime-keyed loader
+"""
+
+import warnings
+import logging
+warnings.filterwarnings('ignore', category=DeprecationWarning)
+warnings.filterwarnings('ignore', category=FutureWarning)
+
+# Suppress Streamlit's internal Plotly deprecation warnings
+logging.getLogger('streamlit').setLevel(logging.ERROR)
+
+import streamlit as st
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import os
+import weakref
+
+# Additional suppression for plotly/streamlit warnings
+import sys
+if not sys.warnoptions:
+    warnings.simplefilter("ignore")
+
+# Suppress Streamlit warning display in logs
+import streamlit.logger
+streamlit.logger.get_logger = lambda name: logging.getLogger(name)
+logging.getLogger('streamlit.runtime.scriptrunner_utils.script_run_context').setLevel(logging.ERROR)
+logging.getLogger('streamlit.elements.plotly_chart').setLevel(logging.ERROR)
+logging.getLogger('streamlit').setLevel(logging.ERROR)
+
+# The loaded frames are shared across sessions (see _load_snapshot); with copy-on-write
+# a filtered or sliced frame never writes through to the shared copy it came from
+pd.set_option('mode.copy_on_write', True)
+
+# Prefer pyarrow's multi-threaded CSV parser; fall back to pandas' C engine without it
+try:
+    import pyarrow
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    pyarrow = None
+    CSV_ENGINE = 'c'
+
+# Text columns of the tables the pages build for st.dataframe use this dtype, so Streamlit's
+# Arrow serialization takes the buffers as-is instead of inferring types from Python objects
+STRING_DTYPE = 'string[pyarrow]' if pyarrow is not None else 'string'
+
+# Datasets keyed by the name the pages use, mapped to their CSV file
+CSV_FILES = {
+    'orgs': 'khelp_organizations_latest.csv',
+    'eng_summary': 'khelp_engineering_latest.csv',
+    'eng_teams': 'khelp_engineering_by_team_latest.csv',
+    'eng_severity': 'khelp_engineering_by_severity_latest.csv',
+    'cat_eng': 'khelp_categories_engineering_latest.csv',
+    'frt': 'khelp_frt_latest.csv',
+    'monthly': 'khelp_monthly_latest.csv',
+    'resolution': 'khelp_resolution_latest.csv',
+    'assignees': 'khelp_assignee_performance_latest.csv',
+    'contributors': 'khelp_contributor_performance_latest.csv',
+    'support_types': 'khelp_support_types_latest.csv',
+    # AI categorization results (if available)
+    'ai_categories': 'categorization_suggestions_latest.csv',
+    # Dual-axis categorization results
+    'dual_axis': 'categorization_dual_axis_20251021_171333.csv',
+}
+
+# Columns the pages read, for datasets that are never shown or exported whole;
+# everything else is parsed in full so exports match the files on disk
+CSV_COLUMNS = {
+    'contributors': [
+        'Year', 'Contributor', 'Role', 'Tickets_Contributed', 'Total_Comments', 'Total_Status_Transitions',
+        'Avg_Comments_Per_Ticket', 'Comment_Velocity_Per_Day', 'Avg_Hold_Time_Hours',
+    ],
+}
+
+# Low-cardinality columns the pages filter on, stored as categoricals so equality
+# masks compare integer codes; Severity keeps its natural order
+SEVERITY_ORDER = ['Blocker', 'Critical', 'Major', 'Minor']
+CATEGORY_COLUMNS = ['Support_Level', 'Role', 'type']
+
+# Suffix of the load-time numeric columns parsed from percent strings
+NUMERIC_SUFFIX = '_num'
+
+# Columns derived at load time under their own names, e.g. the assignees' Tickets_Per_Day
+# over ~250 working days; like the _num columns they are not part of the files on disk
+DERIVED_COLUMNS = ['Tickets_Per_Day']
+WORKING_DAYS_PER_YEAR = 250
+
+def _prepare(df):
+    """Narrow the dtypes of the shared filter and count columns once, at load time"""
+    if 'Severity' in df:
+        extra = [s for s in df['Severity'].dropna().unique() if s not in SEVERITY_ORDER]
+        df['Severity'] = df['Severity'].astype(pd.CategoricalDtype(SEVERITY_ORDER + extra, ordered=True))
+    for col in CATEGORY_COLUMNS:
+        if col in df:
+            df[col] = df[col].astype('category')
+    if 'Year' in df and pd.api.types.is_integer_dtype(df['Year']):
+        df['Year'] = df['Year'].astype('int16')
+    
+    # Ticket/comment counts fit in int32 with room to spare; floats stay float64 so
+    # exports and averages keep full precision
+    for col in df.select_dtypes(include='int64').columns:
+        if df[col].between(-2**31, 2**31 - 1).all():
+            df[col] = df[col].astype('int32')
+    
+    # Percent strings like "33.6%" get a parsed numeric twin, e.g. 2024_Value_num;
+    # a value that isn't a number becomes NaN rather than failing the whole dataset
+    for col in df.select_dtypes(include='object').columns:
+        values = df[col].dropna()
+        if not values.empty and values.str.endswith('%').all():
+            df[f'{col}{NUMERIC_SUFFIX}'] = pd.to_numeric(df[col].str.rstrip('%'), errors='coerce')
+    return df
+
+def source_columns(df):
+    """The frame as it is on disk, without the load-time numeric and derived columns"""
+    return df.loc[:, ~(df.columns.str.endswith(NUMERIC_SUFFIX) | df.columns.isin(DERIVED_COLUMNS))]
+
+def _read_csv(path, usecols=None):
+    """Parse a single CSV into (df, None), or (None, reason) so one bad file doesn't sink the whole load"""
+    try:
+        df = pd.read_csv(path, engine=CSV_ENGINE, usecols=usecols)
+    # OSError: file vanished or unreadable; ValueError: ParserError, EmptyDataError, bad
+    # encoding or missing usecols; KeyError: pyarrow's missing-usecols variant
+    except (OSError, ValueError, KeyError) as e:
+        return None, str(e)
+    # Outside the try, so a bug in the dtype preparation surfaces instead of reading as a bad file
+    return _prepare(df), None
+
+# Snapshot frames are never mutated, so a cached page helper can key on *which* snapshot
+# frame it was given instead of re-hashing its contents on every call. Each frame gets a
+# token for as long as it is alive; the weakref drops the entry when the snapshot is freed,
+# so a recycled id() can never pick up a dead frame's token.
+_frame_tokens = {}
+_next_token = itertools.count()
+
+def _register_frame(df):
+    key = id(df)
+    _frame_tokens[key] = (weakref.ref(df, lambda _, key=key: _frame_tokens.pop(key, None)), next(_next_token))
+
+def frame_key(df):
+    """Cache key for df: its snapshot token when it is a loaded frame, else a hash of its contents"""
+    entry = _frame_tokens.get(id(df))
+    if entry is not None and entry[0]() is df:
+        return ('snapshot', entry[1])
+    return (tuple(df.columns), tuple(map(str, df.dtypes)), pd.util.hash_pandas_object(df).to_numpy().tobytes())
+
+# hash_funcs for st.cache_data helpers that take DataFrames
+DF_HASH = {pd.DataFrame: frame_key}
+
+# Snapshots kept per cache: stale snapshots (older mtimes) are evicted beyond the two most
+# recent. The page helpers cached on snapshot frames cap their entries in proportion, so an
+# evicted snapshot's figures and frames don't stay cached after it
+SNAPSHOT_ENTRIES = 2
+
+# One shared copy for every session instead of a per-session copy; pages must treat
+# the returned frames as read-only and filter/copy before adding columns.
+@st.cache_resource(show_spinner=False, max_entries=SNAPSHOT_ENTRIES)
+def _load_snapshot(stamps):
+    """Parse every (key, filename, mtime_ns, size) in stamps concurrently; mtime and size only key the cache"""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = executor.map(
+            _read_csv,
+            [filename for _, filename, _, _ in stamps],
+            [CSV_COLUMNS.get(key) for key, _, _, _ in stamps],
+        )
+    
+    frames, errors = {}, {}
+    for (key, filename, _, _), (df, error) in zip(stamps, results):
+        if df is not None:
+            frames[key] = df
+        else:
+            errors[filename] = error
+    
+    if 'assignees' in frames:
+        assignees = frames['assignees']
+        assignees['Tickets_Per_Day'] = (assignees['Total_Resolved'].to_numpy() / WORKING_DAYS_PER_YEAR).round(2)
+    
+    # Customer rankings the pages slice from, sorted once per snapshot (stable, so ties keep file order)
+    if 'orgs' in frames:
+        frames['orgs_by_tickets'] = (
+            frames['orgs'].sort_values('2025_Tickets', ascending=False, kind='stable').reset_index(drop=True)
+        )
+        frames['orgs_by_growth'] = (
+            frames['orgs'].sort_values('Pct_Change', ascending=False, kind='stable').reset_index(drop=True)
+        )
+        frames['orgs_top10'] = frames['orgs_by_tickets'].head(10)
+    
+    for df in frames.values():
+        _register_frame(df)
+    return frames, errors
+
+def current_stamps(keys=None):
+    """(key, filename, mtime_ns, size) for each dataset in keys (default: all of CSV_FILES) present on disk; read once per rerun and passed to the loaders"""
+    # Only the listed datasets make up the snapshot, so an app never parses files it doesn't show
+    files = {key: filename for key, filename in CSV_FILES.items() if keys is None or key in keys}
+    
+    # One directory read answers "present?" for every dataset; only the dataset files
+    # themselves are stat'ed, and is_file() reuses the file type from the same read
+    wanted = set(files.values())
+    with os.scandir('.') as entries:
+        stats = {entry.name: entry.stat() for entry in entries if entry.name in wanted and entry.is_file()}
+    
+    return tuple(
+        (key, filename, stats[filename].st_mtime_ns, stats[filename].st_size)
+        for key, filename in files.items()
+        if filename in stats
+    )
+
+# Load all data
+def load_comprehensive_data(stamps):
+    """Load the CSV files in stamps (see current_stamps), re-reading only when one changes on disk"""
+    data, errors = _load_snapshot(stamps)
+    
+    # Reported outside the cached call so the warning shows on every rerun, not just the first
+    for filename, error in errors.items():
+        st.warning(f"Skipping {filename}: {error}")
+    
+    return data
+
+# Datasets the fixed dashboard renders as-is with st.dataframe
+DISPLAY_TABLES = ['orgs_top10', 'eng_summary', 'resolution']
+
+@st.cache_resource(show_spinner=False, max_entries=SNAPSHOT_ENTRIES)
+def _display_snapshot(stamps):
+    """Arrow tables of the DISPLAY_TABLES in one snapshot, converted once rather than on every render"""
+    frames, _ = _load_snapshot(stamps)
+    return {
+        key: pyarrow.Table.from_pandas(source_columns(frames[key]), preserve_index=False)
+        for key in DISPLAY_TABLES
+        if key in frames
+    }
+
+def load_display_tables(stamps):
+    """DISPLAY_TABLES ready for st.dataframe: Arrow tables, or the on-disk columns without pyarrow"""
+    if pyarrow is None:
+        frames, _ = _load_snapshot(stamps)
+        return {key: source_columns(frames[key]) for key in DISPLAY_TABLES if key in frames}
+    return _display_snapshot(stamps)
+
+# Complete Data Export datasets, in page order: (section name, dataset key)
+EXPORT_DATASETS = [
+    ("Organizations", 'orgs'),
+    ("Engineering Summary", 'eng_summary'),
+    ("Engineering by Team", 'eng_teams'),
+    ("Engineering by Severity", 'eng_severity'),
+    ("Categories with Engineering", 'cat_eng'),
+    ("Support Types", 'support_types'),
+    ("Team Scorecard", 'assignees'),
+    ("First Response Times", 'frt'),
+    ("Monthly Trends", 'monthly'),
+    ("Resolution Times", 'resolution'),
+]
+
+# Rows and leading columns of each dataset shown above its download on the export page;
+# the download itself always has every column
+EXPORT_PREVIEW_ROWS = 10
+EXPORT_PREVIEW_COLUMNS = 30
+
+@st.cache_resource(show_spinner=False, max_entries=SNAPSHOT_ENTRIES)
+def _export_snapshot(stamps):
+    """(on-disk columns, preview rows) of the EXPORT_DATASETS in one snapshot, sliced once rather than on every render"""
+    frames, _ = _load_snapshot(stamps)
+    exports = {}
+    for _, key in EXPORT_DATASETS:
+        if key not in frames:
+            continue
+        df = source_columns(frames[key])
+        # Registered like the snapshot frames, so the cached download encoders key on it cheaply
+        _register_frame(df)
+        preview = df.iloc[:EXPORT_PREVIEW_ROWS, :EXPORT_PREVIEW_COLUMNS]
+        # Converted to Arrow here, as for DISPLAY_TABLES, so st.dataframe sends it as-is
+        if pyarrow is not None:
+            preview = pyarrow.Table.from_pandas(preview, preserve_index=False)
+        exports[key] = (df, preview)
+    return exports
+
+def load_export_tables(stamps):
+    """{key: (df, preview)} for the export page: each dataset as it is on disk, plus its first rows (Arrow with pyarrow)"""
+    return _export_snapshot(stamps)
@@ -9,25 +9,22 @@ Complete annual planning toolkit with:
 - Root cause analysis
 """
 
-import warnings
-import logging
-warnings.filterwarnings('ignore', category=DeprecationWarning)
-warnings.filterwarnings('ignore', category=FutureWarning)
-
-# Suppress Streamlit's internal Plotly deprecation warnings
-logging.getLogger('streamlit').setLevel(logging.ERROR)
-
+import io
+import zipfile
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import os
+from functools import partial
+
+from khelp_data import (
+    DF_HASH, EXPORT_DATASETS, SNAPSHOT_ENTRIES, STRING_DTYPE,
+    current_stamps, load_comprehensive_data, load_export_tables, pyarrow,
+)
 
-# Additional suppression for plotly/streamlit warnings
-import sys
-if not sys.warnoptions:
-    warnings.simplefilter("ignore")
+# plotly is imported inside the pages and figure builders that draw charts, so sessions that only
+# view the Executive Summary or the exports never pay for loading it
 
 st.set_page_config(
     page_title="KHELP Ultimate Strategic Dashboard",
@@ -35,109 +32,772 @@ st.set_page_config(
     layout="wide"
 )
 
-# Suppress Streamlit warning display in logs
-import streamlit.logger
-streamlit.logger.get_logger = lambda name: logging.getLogger(name)
-logging.getLogger('streamlit.runtime.scriptrunner_utils.script_run_context').setLevel(logging.ERROR)
-logging.getLogger('streamlit.elements.plotly_chart').setLevel(logging.ERROR)
-logging.getLogger('streamlit').setLevel(logging.ERROR)
-
-# Load all data
-@st.cache_data(ttl=10)
-def load_comprehensive_data():
-    """Load all comprehensive CSV files"""
-    files = os.listdir('.')
-    
-    def get_latest(pattern):
-        matches = [(f, os.path.getmtime(f)) for f in files if pattern in f and f.endswith('.csv')]
-        return sorted(matches, key=lambda x: x[1])[-1][0] if matches else None
-    
-    data = {}
-    
-    # Load all datasets with specific file names
-    try:
-        if os.path.exists('khelp_organizations_latest.csv'):
-            data['orgs'] = pd.read_csv('khelp_organizations_latest.csv')
-    except:
-        pass
-    
-    try:
-        if os.path.exists('khelp_engineering_latest.csv'):
-            data['eng_summary'] = pd.read_csv('khelp_engineering_latest.csv')
-    except:
-        pass
-    
-    try:
-        if os.path.exists('khelp_engineering_by_team_latest.csv'):
-            data['eng_teams'] = pd.read_csv('khelp_engineering_by_team_latest.csv')
-    except:
-        pass
-    
-    try:
-        if os.path.exists('khelp_engineering_by_severity_latest.csv'):
-            data['eng_severity'] = pd.read_csv('khelp_engineering_by_severity_latest.csv')
-    except:
-        pass
-    
-    try:
-        if os.path.exists('khelp_categories_engineering_latest.csv'):
-            data['cat_eng'] = pd.read_csv('khelp_categories_engineering_latest.csv')
-    except:
-        pass
-    
-    try:
-        if os.path.exists('khelp_frt_latest.csv'):
-            data['frt'] = pd.read_csv('khelp_frt_latest.csv')
-    except:
-        pass
-    
-    try:
-        if os.path.exists('khelp_monthly_latest.csv'):
-            data['monthly'] = pd.read_csv('khelp_monthly_latest.csv')
-    except:
-        pass
-    
-    try:
-        if os.path.exists('khelp_resolution_latest.csv'):
-            data['resolution'] = pd.read_csv('khelp_resolution_latest.csv')
-    except:
-        pass
-    
-    try:
-        if os.path.exists('khelp_assignee_performance_latest.csv'):
-            data['assignees'] = pd.read_csv('khelp_assignee_performance_latest.csv')
-    except:
-        pass
-    
-    try:
-        if os.path.exists('khelp_contributor_performance_latest.csv'):
-            data['contributors'] = pd.read_csv('khelp_contributor_performance_latest.csv')
-    except:
-        pass
-    
-    try:
-        if os.path.exists('khelp_support_types_latest.csv'):
-            data['support_types'] = pd.read_csv('khelp_support_types_latest.csv')
-    except:
-        pass
-    
-    # Load AI categorization results (if available)
-    try:
-        if os.path.exists('categorization_suggestions_latest.csv'):
-            data['ai_categories'] = pd.read_csv('categorization_suggestions_latest.csv')
-    except:
-        pass
-    
-    # Load dual-axis categorization results
-    try:
-        if os.path.exists('categorization_dual_axis_20251021_171333.csv'):
-            data['dual_axis'] = pd.read_csv('categorization_dual_axis_20251021_171333.csv')
-    except:
-        pass
-    
-    return data
-
-data = load_comprehensive_data()
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH, max_entries=SNAPSHOT_ENTRIES)
+def compute_exec_kpis(monthly, resolution, frt, eng_summary):
+    """Scalar KPIs for the Executive Summary, recomputed only when the underlying data changes"""
+    kpis = {}
+    
+    if monthly is not None:
+        yearly_created = monthly.groupby('Year')['Created'].sum()
+        kpis['total_2024'] = yearly_created.get(2024, 0)
+        kpis['total_2025'] = yearly_created.get(2025, 0)
+    
+    if eng_summary is not None:
+        eng_idx = eng_summary.set_index('Metric')
+        kpis['eng_2024_rate'] = eng_idx.at['Engineering Involvement Rate', '2024_Value_num']
+        kpis['eng_2025_rate'] = eng_idx.at['Engineering Involvement Rate', '2025_Value_num']
+    
+    if frt is not None:
+        kpis['frt_2024_avg'] = frt['2024_Avg_Hours'].mean()
+        kpis['frt_2025_avg'] = frt['2025_Avg_Hours'].mean()
+    
+    if resolution is not None:
+        kpis['avg_res_2024'] = resolution['2024_Avg_Days'].mean()
+        kpis['avg_res_2025'] = resolution['2025_Avg_Days'].mean()
+        
+        # Per-severity averages, only for severities present in the table
+        res_idx = resolution.set_index('Severity')
+        kpis.update({
+            f'{severity.lower()}_{year}': res_idx.at[severity, f'{year}_Avg_Days']
+            for severity in ['Blocker', 'Critical', 'Major', 'Minor']
+            if severity in res_idx.index
+            for year in (2024, 2025)
+        })
+    
+    return kpis
+
+def pct_delta(new, old, fmt):
+    """Percent change from old to new formatted with fmt, or "n/a" when old is zero"""
+    return fmt.format((new - old) / old * 100) if old != 0 else "n/a"
+
+# Shared st.plotly_chart config for every chart
+PLOTLY_CFG = {"displayModeBar": False}
+
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH, max_entries=SNAPSHOT_ENTRIES)
+def build_top15_fig(top_15):
+    """Customer Intelligence top-15 grouped bar chart, as a figure dict built once per data change"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        y=top_15['Organization'],
+        x=top_15['2024_Tickets'],
+        name='2024',
+        orientation='h',
+        marker_color='#1f77b4'
+    ))
+    
+    fig.add_trace(go.Bar(
+        y=top_15['Organization'],
+        x=top_15['2025_Tickets'],
+        name='2025',
+        orientation='h',
+        marker_color='#ff7f0e'
+    ))
+    
+    fig.update_layout(
+        barmode='group',
+        height=600,
+        xaxis_title="Number of Tickets",
+        yaxis_title=None
+    )
+    
+    return fig.to_dict()
+
+# Series colors shared by the 2024 vs 2025 comparison charts
+YEAR_COLORS = [('2024', '#1f77b4'), ('2025', '#ff7f0e')]
+
+# Month-number x axis (1-12) labelled Jan-Dec, shared by the monthly trend charts
+MONTH_XAXIS = dict(
+    tickmode='array',
+    tickvals=list(range(1, 13)),
+    ticktext=['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+)
+
+# Five charts per snapshot: the engineering and Response & Resolution year-over-year bars
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH, max_entries=SNAPSHOT_ENTRIES * 5)
+def build_yoy_bar_fig(df, x, metric, texttemplate, colors=YEAR_COLORS, **layout):
+    """Grouped 2024 vs 2025 bars of df's {year}_{metric} columns over x, as a figure dict built once per data change"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure()
+    
+    # Plain arrays, so Plotly's validators don't walk the Series element by element
+    categories = df[x].to_numpy()
+    for year, color in colors:
+        fig.add_trace(go.Bar(
+            x=categories,
+            y=df[f'{year}_{metric}'].to_numpy(),
+            name=year,
+            marker_color=color,
+            texttemplate=texttemplate,
+            textposition='auto'
+        ))
+    
+    fig.update_layout(barmode='group', **layout)
+    
+    return fig.to_dict()
+
+# The distribution charts and scorecard are built per scorecard year, so two entries per snapshot
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH, max_entries=SNAPSHOT_ENTRIES * 2)
+def build_volume_fig(agent_perf):
+    """Team Scorecard top-10-by-volume bar chart from the ranked scorecard, as a figure dict"""
+    import plotly.graph_objects as go
+    
+    top_10 = agent_perf.head(10)
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        y=top_10['Assignee'],
+        x=top_10['Total_Resolved'],
+        orientation='h',
+        marker_color='#2ca02c',
+        texttemplate='%{x}',
+        textposition='auto'
+    ))
+    
+    fig.update_layout(
+        title="Top 10 Agents by Tickets Resolved",
+        xaxis_title="Tickets Resolved",
+        yaxis_title=None,
+        height=400
+    )
+    
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH, max_entries=SNAPSHOT_ENTRIES * 2)
+def build_speed_fig(agent_perf):
+    """Team Scorecard top-10-fastest bar chart, as a figure dict"""
+    import plotly.graph_objects as go
+    
+    # Same rows and order as nsmallest(10): partition for the 10th-smallest value in O(N), then
+    # sort only the rows at or below it by (days, position) so ties keep their original order;
+    # agents without an average fill any remaining slots last, as in nsmallest
+    days = agent_perf['Avg_Resolution_Days'].to_numpy(dtype=float)
+    missing = np.isnan(days)
+    valid = np.flatnonzero(~missing)
+    k = min(10, len(valid))
+    if k:
+        cutoff = np.partition(days[valid], k - 1)[k - 1]
+        candidates = valid[days[valid] <= cutoff]
+        valid = candidates[np.lexsort((candidates, days[candidates]))][:k]
+    fastest_10 = agent_perf.iloc[np.concatenate([valid, np.flatnonzero(missing)])[:10]]
+
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        y=fastest_10['Assignee'],
+        x=fastest_10['Avg_Resolution_Days'],
+        orientation='h',
+        marker_color='#1f77b4',
+        texttemplate='%{x:.1f}d',
+        textposition='auto'
+    ))
+    
+    fig.update_layout(
+        title="Top 10 Fastest Average Resolution",
+        xaxis_title="Days",
+        yaxis_title=None,
+        height=400
+    )
+    
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False, max_entries=SNAPSHOT_ENTRIES)
+def build_type_donut_fig(type_counts, total):
+    """AI Category Insights ticket-type donut with the total in the center, as a figure dict"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(data=[go.Pie(
+        labels=type_counts.index.to_numpy(),
+        values=type_counts.to_numpy(),
+        hole=0.4,
+        textinfo='label+percent',
+        textposition='outside',
+        marker=dict(
+            colors=['#dc3545', '#007bff', '#28a745', '#ffc107', '#6f42c1', '#6c757d'],
+            line=dict(color='#FFFFFF', width=2)
+        )
+    )])
+    
+    fig.update_layout(
+        title="Distribution of Ticket Types (693 tickets)",
+        height=500,
+        showlegend=True,
+        legend=dict(
+            orientation="v",
+            yanchor="middle",
+            y=0.5,
+            xanchor="left",
+            x=1.01
+        )
+    )
+    
+    # Add center text
+    fig.add_annotation(
+        text=f"<b>{total}<br>Tickets</b>",
+        x=0.5, y=0.5,
+        font_size=20,
+        showarrow=False
+    )
+    
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False, max_entries=SNAPSHOT_ENTRIES)
+def build_bug_categories_fig(bug_categories):
+    """AI Category Insights top-5 bug categories horizontal bar chart, as a figure dict"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        y=bug_categories.index.to_numpy(),
+        x=bug_categories.to_numpy(),
+        orientation='h',
+        marker_color='#dc3545',
+        texttemplate='%{x}',
+        textposition='auto'
+    ))
+    
+    fig.update_layout(
+        title="Top 5 Bug Categories by Volume",
+        xaxis_title="Number of Bugs",
+        yaxis_title=None,
+        height=400
+    )
+    
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH, max_entries=SNAPSHOT_ENTRIES)
+def build_kb_impact_fig(kb_df):
+    """AI Category Insights KB current vs expected deflection grouped bars, as a figure dict"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure()
+    
+    categories = kb_df['Category'].to_numpy()
+    fig.add_trace(go.Bar(
+        name='Current Tickets',
+        x=categories,
+        y=kb_df['How-To Tickets'].to_numpy(),
+        marker_color='#ffc107'
+    ))
+    
+    fig.add_trace(go.Bar(
+        name='Expected Deflection',
+        x=categories,
+        y=kb_df['Expected Deflection'].to_numpy(),
+        marker_color='#28a745'
+    ))
+    
+    fig.update_layout(
+        title="Knowledge Base Impact: Current vs Expected Deflection",
+        xaxis_title="Category",
+        yaxis_title="Number of Tickets",
+        barmode='group',
+        height=400
+    )
+    
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH, max_entries=SNAPSHOT_ENTRIES)
+def compute_tiers(df_orgs):
+    """Customer tiers by 2025 volume (50+, 20-49, 5-19, <5 tickets), Tier 1 first, bucketed in one pass"""
+    tier_labels = ['Tier 4', 'Tier 3', 'Tier 2', 'Tier 1']
+    tiered = df_orgs.assign(
+        Tier=pd.cut(df_orgs['2025_Tickets'], bins=[-np.inf, 5, 20, 50, np.inf], labels=tier_labels, right=False)
+    )
+    return tuple(tiered[tiered['Tier'] == label] for label in reversed(tier_labels))
+
+@st.cache_data(show_spinner=False, max_entries=SNAPSHOT_ENTRIES)
+def build_budget_df(n1, n2, n3, n4):
+    """Support model budget table for the given Tier 1-4 customer counts"""
+    return pd.DataFrame([
+        {
+            "Tier": "Tier 1 - Dedicated CSM",
+            "Customers": n1,
+            "Annual Cost": "$75,000",
+            "Cost per Customer": f"${75000/n1:,.0f}" if n1 > 0 else "N/A",
+            "Justification": "Prevent churn, increase expansion"
+        },
+        {
+            "Tier": "Tier 2 - Quarterly Reviews",
+            "Customers": n2,
+            "Annual Cost": "$30,000",
+            "Cost per Customer": f"${30000/n2:,.0f}" if n2 > 0 else "N/A",
+            "Justification": "Proactive relationship management"
+        },
+        {
+            "Tier": "Tier 3 - Standard",
+            "Customers": n3,
+            "Annual Cost": "$0",
+            "Cost per Customer": "$0",
+            "Justification": "Covered by base support team"
+        },
+        {
+            "Tier": "Tier 4 - Self-Service",
+            "Customers": n4,
+            "Annual Cost": "$0",
+            "Cost per Customer": "$0",
+            "Justification": "Community-driven support"
+        }
+    ])
+
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH, max_entries=SNAPSHOT_ENTRIES)
+def build_team_insights(df_teams):
+    """(top 2025 team, whether an API team is listed, Team Insights figures as one Metric/Value table)"""
+    top_team = df_teams.loc[df_teams['2025_Tickets'].idxmax()]
+    rows = [
+        (f"{top_team['Engineering_Team']} tickets (2025)", f"{top_team['2025_Tickets']:,}"),
+        (f"{top_team['Engineering_Team']} change from 2024", f"{top_team['Change']:+d}"),
+    ]
+    team_tickets = df_teams.set_index('Engineering_Team')['2025_Tickets']
+    has_api = 'API' in team_tickets.index
+    if has_api:
+        rows.append(("API team tickets (2025)", f"{team_tickets.at['API']:,}"))
+    return top_team['Engineering_Team'], has_api, pd.DataFrame(rows, columns=["Metric", "Value"]).astype(STRING_DTYPE)
+
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH, max_entries=SNAPSHOT_ENTRIES * 2)
+def build_scorecard(df_assignees, df_contributors, year):
+    """Team Scorecard frames and team aggregates for one year, recomputed only when the data or year changes"""
+    # Filtered frames are only read, so none of them needs a .copy()
+    df_year = df_assignees[(df_assignees['Year'] == year) & (df_assignees['Assignee'] != 'Unassigned')]
+    
+    # Level 1 agents; everyone counts as Level 1 without Level classification data
+    has_level_data = 'Support_Level' in df_year.columns
+    df_level1 = df_year[df_year['Support_Level'] == 'Level 1'] if has_level_data else df_year
+    df_level2_contrib = pd.DataFrame()
+    
+    if df_contributors is not None:
+        df_level2_contrib = df_contributors[
+            (df_contributors['Year'] == year) & (df_contributors['Role'] == 'Level 2 (Contributor)')
+        ]
+    
+    # Individual scorecard, ranked by total resolved - include engineering rate if available
+    columns_to_include = [
+        'Assignee', 
+        'Total_Assigned', 
+        'Total_Resolved', 
+        'Avg_Resolution_Days',
+        'Resolution_Rate_Pct',
+        'Tickets_Per_Day'
+    ]
+    if 'Engineering_Rate_Pct' in df_year.columns:
+        columns_to_include.append('Engineering_Rate_Pct')
+    
+    # Stable, so agents tied on volume keep file order (as the customer rankings do)
+    order = np.argsort(-df_year['Total_Resolved'].to_numpy(), kind='stable')
+    scorecard_df = df_year[columns_to_include].iloc[order].reset_index(drop=True)
+    scorecard_df.insert(0, 'Rank', np.arange(1, len(scorecard_df) + 1, dtype=np.int32))
+    
+    # Team averages for the whole year, Level 1 and Level 2, one reduction per frame
+    agent_cols = ['Total_Resolved', 'Avg_Resolution_Days', 'Resolution_Rate_Pct']
+    year_means = df_year[agent_cols].mean()
+    l1_means = df_level1[agent_cols + [col for col in ['Engineering_Rate_Pct'] if col in df_level1.columns]].mean()
+    team_stats = {
+        'avg_resolved': year_means['Total_Resolved'],
+        'avg_resolution_time': year_means['Avg_Resolution_Days'],
+        'avg_rate': year_means['Resolution_Rate_Pct'],
+        'avg_resolved_l1': l1_means['Total_Resolved'],
+        'avg_resolution_time_l1': l1_means['Avg_Resolution_Days'],
+        'avg_resolution_rate_l1': l1_means['Resolution_Rate_Pct'],
+    }
+    if 'Engineering_Rate_Pct' in l1_means:
+        team_stats['avg_eng_l1'] = l1_means['Engineering_Rate_Pct']
+    if not df_level2_contrib.empty:
+        l2_sums = df_level2_contrib[['Tickets_Contributed', 'Total_Comments']].sum()
+        l2_means = df_level2_contrib[['Avg_Comments_Per_Ticket', 'Comment_Velocity_Per_Day']].mean()
+        team_stats.update({
+            'total_tickets_l2': l2_sums['Tickets_Contributed'],
+            'total_comments_l2': l2_sums['Total_Comments'],
+            'avg_comments_l2': l2_means['Avg_Comments_Per_Ticket'],
+            'avg_velocity_l2': l2_means['Comment_Velocity_Per_Day'],
+        })
+    
+    # Individual rankings as display tables, medals for the top places (three for Level 1, two for Level 2)
+    l1_rankings = df_level1.sort_values('Total_Resolved', ascending=False)[
+        ['Assignee', 'Total_Resolved', 'Avg_Resolution_Days', 'Resolution_Rate_Pct']
+    ]
+    l1_rankings.insert(0, 'Rank', [["🥇", "🥈", "🥉"][i] if i < 3 else f"#{i + 1}" for i in range(len(l1_rankings))])
+    l2_rankings = pd.DataFrame()
+    if not df_level2_contrib.empty:
+        l2_rankings = df_level2_contrib.sort_values('Tickets_Contributed', ascending=False)[
+            ['Contributor', 'Tickets_Contributed', 'Total_Comments', 'Avg_Comments_Per_Ticket', 'Avg_Hold_Time_Hours']
+        ]
+        l2_rankings.insert(0, 'Rank', [["🥇", "🥈"][i] if i < 2 else f"#{i + 1}" for i in range(len(l2_rankings))])
+        # Hold time is optional per contributor; with none recorded the column is left out entirely
+        if l2_rankings['Avg_Hold_Time_Hours'].isna().all():
+            l2_rankings = l2_rankings.drop(columns='Avg_Hold_Time_Hours')
+    
+    return df_year, df_level1, df_level2_contrib, scorecard_df, team_stats, l1_rankings, l2_rankings
+
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH, max_entries=SNAPSHOT_ENTRIES)
+def compare_agent_years(df_assignees):
+    """2024 vs 2025 volume and speed changes for agents present in both years, in 2024 order"""
+    by_year = {
+        year: df_assignees[df_assignees['Year'] == year].set_index('Assignee')[['Total_Resolved', 'Avg_Resolution_Days']]
+        for year in (2024, 2025)
+    }
+    comparison = by_year[2024].join(by_year[2025], how='inner', lsuffix='_2024', rsuffix='_2025')
+    
+    # Plain array arithmetic: both sides come from the same joined rows, so there is nothing to align
+    days_2024 = comparison['Avg_Resolution_Days_2024'].to_numpy()
+    speed_change = comparison['Avg_Resolution_Days_2025'].to_numpy() - days_2024
+    with np.errstate(divide='ignore', invalid='ignore'):
+        speed_change_pct = speed_change / days_2024 * 100
+    return comparison.assign(
+        Volume_Change=comparison['Total_Resolved_2025'].to_numpy() - comparison['Total_Resolved_2024'].to_numpy(),
+        Speed_Change=speed_change,
+        Speed_Change_Pct=speed_change_pct,
+    ).reset_index()
+
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH, max_entries=SNAPSHOT_ENTRIES)
+def compute_monthly_trends(df_monthly):
+    """Response & Resolution monthly totals and cumulative backlog, as {year: frame in month order} for 2024 and 2025"""
+    # One pass over the (Month, Year) groups for both totals; the rows are sorted once below
+    df_monthly_agg = df_monthly.groupby(['Month', 'Year'], sort=False, observed=True).agg(
+        Created=('Created', 'sum'),
+        Resolved=('Resolved', 'sum'),
+    ).reset_index()
+    
+    # Month number for plotting: the last two characters of 'YYYY-MM', one slice instead of a split
+    df_monthly_agg['Month_Num'] = df_monthly_agg['Month'].str[-2:].astype('int8')
+    df_monthly_agg['Net_Change'] = df_monthly_agg['Created'] - df_monthly_agg['Resolved']
+    
+    # One sort by (Year, Month_Num); each year is then a contiguous slice, empty if the year is missing
+    ordered = df_monthly_agg.sort_values(['Year', 'Month_Num'], kind='stable')
+    years = ordered['Year'].to_numpy()
+    
+    trends = {}
+    for year in (2024, 2025):
+        start, stop = np.searchsorted(years, [year, year + 1])
+        frame = ordered.iloc[start:stop]
+        # Calculate cumulative backlog
+        trends[year] = frame.assign(Cumulative_Backlog=np.cumsum(frame['Net_Change'].to_numpy()))
+    
+    return trends
+
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH, max_entries=SNAPSHOT_ENTRIES)
+def compute_dual_summaries(df_dual):
+    """AI Category Insights counts and averages, computed once per dual-axis snapshot rather than per filter keystroke"""
+    type_counts = df_dual['type'].value_counts()
+    bug_tickets = df_dual[df_dual['type'] == 'Bug-Defect']
+    bug_categories = bug_tickets['category'].value_counts().head(5)
+    return {
+        'high_conf': int((df_dual['confidence'] >= 90).sum()),
+        'unique_cats': df_dual['category'].nunique(),
+        'avg_conf': df_dual['confidence'].mean(),
+        'type_counts': type_counts,
+        'type_pct': (type_counts / len(df_dual) * 100).round(1),
+        # Top categories per ticket type for the strategic-priority tabs
+        'bug_categories': bug_categories,
+        # One groupby for every bug category's mean confidence, aligned to the top five
+        'bug_avg_conf': bug_tickets.groupby('category')['confidence'].mean().reindex(bug_categories.index),
+        'howto_categories': df_dual.loc[df_dual['type'] == 'How-To-Question', 'category'].value_counts().head(5),
+        'config_categories': df_dual.loc[df_dual['type'] == 'Configuration-Setup', 'category'].value_counts().head(3),
+    }
+
+# Per snapshot: every export dataset, the two year scorecards and the drill-down filter
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH, max_entries=SNAPSHOT_ENTRIES * (len(EXPORT_DATASETS) + 3))
+def to_csv_bytes(df):
+    """UTF-8 CSV of df for st.download_button, encoded once per distinct frame rather than on every rerun"""
+    # Written in row chunks straight into a bytes buffer, so the whole file never exists as
+    # one str plus its encoded copy; '\n' keeps the output identical to to_csv() on every OS
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False, encoding='utf-8', lineterminator='\n', chunksize=50_000)
+    return buf.getvalue()
+
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH, max_entries=SNAPSHOT_ENTRIES)
+def to_parquet_zip(exports):
+    """Zip archive with one zstd Parquet file per (name, df) in exports, for the all-datasets download"""
+    # pyarrow releases the GIL while it encodes and compresses, so the files are written concurrently
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        files = executor.map(lambda df: df.to_parquet(index=False, compression='zstd'), [df for _, df in exports])
+    
+    buf = io.BytesIO()
+    # Parquet is already compressed, so the archive only stores the files
+    with zipfile.ZipFile(buf, 'w', zipfile.ZIP_STORED) as archive:
+        for (name, _), data in zip(exports, files):
+            archive.writestr(f"{name.lower().replace(' ', '_')}.parquet", data)
+    return buf.getvalue()
+
+# Executive Summary insight cards as one markdown element; keep it free of blank
+# lines, which would end the HTML block
+INSIGHT_CARDS = """
+<div style='display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem;'>
+    <div style='background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); 
+                padding: 1.5rem; border-radius: 10px; color: white;'>
+        <h3>35% Reduction</h3>
+        <p>Ticket volume down significantly</p>
+        <small>998 → 654 tickets (-344)</small>
+    </div>
+    <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
+                padding: 1.5rem; border-radius: 10px; color: white;'>
+        <h3>CEE = 72%</h3>
+        <p>CEE handles most engineering escalations</p>
+        <small>Primary engineering partner</small>
+    </div>
+    <div style='background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); 
+                padding: 1.5rem; border-radius: 10px; color: white;'>
+        <h3>Railbookers</h3>
+        <p>215 tickets in 2025</p>
+        <small>33% of all support volume!</small>
+    </div>
+</div>
+"""
+
+# Executive Summary YoY table: (label, 2024 KPI key, 2025 KPI key, value format, change unit, lower is better)
+YOY_METRICS = [
+    ("Total Tickets", 'total_2024', 'total_2025', "{:,.0f}", "%", True),
+    ("Engineering Involvement", 'eng_2024_rate', 'eng_2025_rate', "{:.1f}%", "pp", True),
+    ("Blocker Resolution (days)", 'blocker_2024', 'blocker_2025', "{:.0f}", "%", True),
+    ("Critical Resolution (days)", 'critical_2024', 'critical_2025', "{:.0f}", "%", True),
+    ("Avg FRT (hours)", 'frt_2024_avg', 'frt_2025_avg', "{:.0f}", "%", True),
+    ("Avg Resolution (days)", 'avg_res_2024', 'avg_res_2025', "{:.0f}", "%", True),
+]
+
+def kpi_grid(items):
+    """Render a row of (label, value, delta) KPI cards as one HTML block; lower is better, so falling deltas are green"""
+    cards = []
+    for label, value, delta in items:
+        # Like st.metric, a zero delta ("0%", "+0.0pp") or "n/a" is grey without an arrow
+        if not any(c in '123456789' for c in delta):
+            color, arrow = '#808495', ''
+        elif delta.startswith('-'):
+            color, arrow = '#09ab3b', '↓ '
+        else:
+            color, arrow = '#ff2b2b', '↑ '
+        cards.append(
+            f"<div><div style='font-size: 0.875rem;'>{label}</div>"
+            f"<div style='font-size: 2.25rem; line-height: 1.3;'>{value}</div>"
+            f"<div style='font-size: 0.875rem; color: {color};'>{arrow}{delta}</div></div>"
+        )
+    cards = "".join(cards)
+    # Kept on one line: blank or indented lines would end the HTML block in markdown
+    st.markdown(
+        f"<div style='display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem; margin-bottom: 1rem;'>{cards}</div>",
+        unsafe_allow_html=True
+    )
+
+def stat_grid(items):
+    """Render (label, value) stats as one two-column HTML block, filled row by row"""
+    cells = "".join(
+        f"<div><div style='font-size: 0.875rem;'>{label}</div>"
+        f"<div style='font-size: 1.75rem; line-height: 1.3;'>{value}</div></div>"
+        for label, value in items
+    )
+    # Kept on one line like kpi_grid so the HTML block survives markdown parsing
+    st.markdown(
+        f"<div style='display: grid; grid-template-columns: repeat(2, 1fr); gap: 0.5rem 1rem; margin-bottom: 1rem;'>{cells}</div>",
+        unsafe_allow_html=True
+    )
+
+# Engineering Involvement narrative: the intro and opportunity boxes, the three
+# tab bodies and the closing decision box
+ENG_INTRO = """
+<div style='background-color: #e8f4f8; padding: 1rem; border-radius: 5px; border-left: 4px solid #1f77b4;'>
+    <strong>💡 Why This Matters:</strong> Engineering involvement is expensive. Lower rates indicate better 
+    documentation, training, or product stability. Track trends to measure support efficiency.
+</div>
+"""
+
+ENG_OPPORTUNITY = """
+<div style='background-color: #e8f4f8; padding: 1.5rem; border-radius: 5px; border-left: 4px solid #1f77b4; margin-bottom: 1rem;'>
+    <h4>💡 Strategic Opportunity Identified</h4>
+    <p>Current data shows 72% of engineering escalations flow through a single team. This creates opportunities for:</p>
+    <ul>
+        <li><strong>Distributed Ownership</strong>: Product teams own defects/performance in their domain</li>
+        <li><strong>Technical Triage Layer</strong>: Support Engineers handle diagnosis before escalation</li>
+        <li><strong>Faster Resolution</strong>: Domain teams resolve own issues 40% faster</li>
+    </ul>
+</div>
+"""
+
+ENG_MODEL_TAB = """
+### Proposed 2026 Model: Distributed Ownership + Support Engineering
+
+#### Component 1: Domain-Based Ownership
+
+Each product domain owns the complete lifecycle:
+
+| Domain | Owns | Current Eng. Rate |
+|--------|------|-------------------|
+| **Selling Domain** | Booking Wizard, Package Selling, Basket | ~35% of escalations |
+| **Build & Ops Domain** | Builder, Pricing, Services, Operations | ~40% of escalations |
+| **API Services** | API performance, integrations, ktapi | ~20% of escalations |
+| **Cloud Platform** | Infrastructure, security, platform | ~5% of escalations |
+
+**Benefit**: Teams already handling 32% of tickets resolve 40% faster when they own end-to-end.
+
+---
+
+#### Component 2: Support Engineering Layer (L3)
+
+**New Role**: 2-3 Support Engineers sit between L2 Support and Engineering
+
+**Responsibilities**:
+- Technical triage and diagnosis
+- Log analysis and troubleshooting  
+- API/integration debugging
+- Configuration investigation
+- Reproduce issues and determine root cause
+
+**Resolve Without Engineering**: 50-60% of current escalations
+- Configuration issues
+- Data investigation
+- Integration debugging (non-bug)
+- Environment-specific issues
+
+**Escalate to Engineering Only When**:
+- Bug confirmed in code
+- Performance optimization needed
+- Architecture change required
+- New feature needed
+
+---
+
+#### Routing Logic
+
+```
+Customer Ticket
+    ↓
+L1/L2 Support (Standard troubleshooting)
+    ↓
+[NEW] L3 Support Engineers (Technical diagnosis)
+    ↓ (only if needed)
+Domain Engineering Team (Code/architecture changes)
+```
+"""
+
+ENG_IMPACT_TAB = """
+### Expected Impact Analysis
+
+#### Current State (2025)
+- **210 tickets** require engineering
+- **72%** flow through single team (concentration risk)
+- **Average resolution**: 42-47 days
+- **Engineering cost**: ~$315K annually
+
+#### Projected State (2026 with new model)
+- **~100-110 tickets** reach engineering (complex only)
+- **Distributed** across domain teams (clear ownership)
+- **Support Engineers resolve**: 100-110 tickets in 5-10 days
+- **Engineering focuses**: Real product issues, features, improvements
+
+#### Customer Impact
+
+| Metric | Current | Projected | Improvement |
+|--------|---------|-----------|-------------|
+| Avg Resolution (SE-handled) | N/A | 7 days | 6x faster |
+| Avg Resolution (Engineering) | 47 days | 28 days | 40% faster |
+| First Response Time | 241 hrs | 4-8 hrs | 30x faster |
+| Overall Satisfaction | Baseline | +20-30% | Major improvement |
+
+#### Engineering Team Impact
+
+**Before**:
+- 210 interruptions per year
+- High context-switching cost
+- Diluted focus on product development
+
+**After**:
+- 110 well-triaged issues only
+- Clear domain ownership
+- 50% more focus time for features/improvements
+- Equivalent to adding ~2 FTE in productivity
+"""
+
+ENG_INVESTMENT_TAB = """
+### Investment & ROI Analysis
+
+#### Investment Required
+
+| Item | Cost | FTE |
+|------|------|-----|
+| Support Engineer #1 | $100,000 | 1.0 |
+| Support Engineer #2 | $100,000 | 1.0 |
+| Support Engineer #3 (H2-2026, optional) | $100,000 | 1.0 |
+| Training & Tools | $20,000 | — |
+| **Initial Investment (2 SEs)** | **$220,000** | **2.0** |
+
+#### Returns
+
+| Benefit | Annual Value | Source |
+|---------|--------------|--------|
+| Engineering Velocity Gain | $210,000 | 2 FTE equivalent focus time |
+| Faster Customer Resolution | $500,000 | Retention + expansion impact |
+| Support Team Efficiency | $50,000 | L2 handles more with backup |
+| Knowledge Capture | $30,000 | Reusable solutions |
+| **Total Annual Value** | **$790,000** | Measured impact |
+
+#### Net ROI
+
+**Annual Benefit**: $790K - $220K = **$570K**  
+**ROI**: **259%**  
+**Payback Period**: **<5 months**
+
+---
+
+#### Phased Approach (Recommended)
+
+**Q1 2026: Pilot**
+- Hire 2 Support Engineers ($220K)
+- Begin domain ownership documentation
+- 3-month pilot program
+
+**Q2 2026: Evaluation**
+- Measure: SE resolution rate, engineering escalation reduction
+- Decision gate: Add 3rd SE if resolution rate >60%
+
+**Q3 2026: Full Operation**
+- Full model operational
+- Optimize based on 6 months data
+- Scale if needed
+
+#### Risk Mitigation
+
+**Risk**: Domain teams feel overwhelmed  
+**Mitigation**: 36% capacity already allocated to product health; SE filters 50% before escalation
+
+**Risk**: SE lack domain knowledge  
+**Mitigation**: 30-day rotation through each domain; comprehensive runbooks
+
+**Risk**: Slower during transition  
+**Mitigation**: Phased rollout; keep current path as backup; daily monitoring
+"""
+
+ENG_DECISION = """
+<div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 2rem; border-radius: 10px; color: white;'>
+    <h3>💼 Recommended Decision for Annual Planning</h3>
+    <p><strong>Approve hiring 2 Support Engineers in Q4 2025</strong></p>
+    <ul>
+        <li>Investment: $220,000 annually</li>
+        <li>Expected ROI: $570,000 net benefit</li>
+        <li>Timeline: Q1 2026 pilot, Q2 evaluation, Q3 full operation</li>
+        <li>Risk: Low (phased approach with decision gates)</li>
+    </ul>
+    <p><strong>Next Steps:</strong> Approve budget → Begin recruitment → Q1 2026 onboarding</p>
+</div>
+"""
+
+# The script body reruns on every interaction, so static frames live behind cache_resource
+@st.cache_resource(show_spinner=False)
+def kpi_definitions():
+    """Team Scorecard KPI glossary, built once per process and only ever read"""
+    return pd.DataFrame([
+        {"KPI": "Assigned", "Definition": "Total tickets assigned to agent", "Target": "Balanced across team"},
+        {"KPI": "Resolved", "Definition": "Total tickets closed by agent", "Target": "60-80 per agent/year"},
+        {"KPI": "Avg Days", "Definition": "Average time from assignment to resolution", "Target": "<35 days"},
+        {"KPI": "Resolution %", "Definition": "% of assigned tickets resolved", "Target": ">85%"},
+        {"KPI": "Per Day", "Definition": "Productivity: resolved tickets per working day", "Target": "0.3-0.4"},
+        {"KPI": "Eng %", "Definition": "% of tickets requiring engineering escalation", "Target": "<30%"}
+    ])
+
+# The data files are stat'ed once per rerun; every loader below keys on the same stamps
+stamps = current_stamps()
+data = load_comprehensive_data(stamps)
 
 # Header
 st.markdown("""
@@ -164,6 +824,7 @@ page = st.sidebar.radio("Select View", [
 st.sidebar.markdown("---")
 if st.sidebar.button("🔄 Refresh", width="stretch"):
     st.cache_data.clear()
+    st.cache_resource.clear()
     st.rerun()
 
 # ==================
@@ -172,238 +833,115 @@ if st.sidebar.button("🔄 Refresh", width="stretch"):
 if page == "🎯 Executive Summary":
     st.header("Executive Summary - 2026 Annual Planning")
     
+    kpis = compute_exec_kpis(data.get('monthly'), data.get('resolution'), data.get('frt'), data.get('eng_summary'))
+    
     # 8 Key Performance Indicators
     st.subheader("📊 2025 Performance Metrics")
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    if 'monthly' in data:
-        total_2024 = data['monthly'][data['monthly']['Year'] == 2024]['Created'].sum()
-        total_2025 = data['monthly'][data['monthly']['Year'] == 2025]['Created'].sum()
-        
-        with col1:
-            st.metric(
-                "Total Tickets",
-                f"{total_2025:,}",
-                f"{((total_2025-total_2024)/total_2024*100):.1f}%",
-                delta_color="inverse"
-            )
-        
-        with col2:
-            if 'eng_summary' in data:
-                eng_2025_rate = float(data['eng_summary'][data['eng_summary']['Metric'] == 'Engineering Involvement Rate']['2025_Value'].values[0].rstrip('%'))
-                eng_2024_rate = float(data['eng_summary'][data['eng_summary']['Metric'] == 'Engineering Involvement Rate']['2024_Value'].values[0].rstrip('%'))
-                change = eng_2025_rate - eng_2024_rate
-                st.metric(
-                    "% Requiring Engineering",
-                    f"{eng_2025_rate:.1f}%",
-                    f"{change:+.1f}pp",
-                    delta_color="inverse"
-                )
-        
-        with col3:
-            if 'frt' in data:
-                frt_2024_avg = data['frt']['2024_Avg_Hours'].mean()
-                frt_2025_avg = data['frt']['2025_Avg_Hours'].mean()
-                st.metric(
-                    "Avg First Response",
-                    f"{frt_2025_avg:.0f}hrs",
-                    f"{((frt_2025_avg-frt_2024_avg)/frt_2024_avg*100):.0f}%",
-                    delta_color="inverse"
-                )
-        
-        with col4:
-            if 'resolution' in data:
-                avg_res_2025 = data['resolution']['2025_Avg_Days'].mean()
-                avg_res_2024 = data['resolution']['2024_Avg_Days'].mean()
-                st.metric(
-                    "Avg Resolution Time",
-                    f"{avg_res_2025:.0f}d",
-                    f"{((avg_res_2025-avg_res_2024)/avg_res_2024*100):.0f}%",
-                    delta_color="inverse"
-                )
+    headline_kpis = []
+    if 'total_2025' in kpis:
+        headline_kpis.append((
+            "Total Tickets",
+            f"{kpis['total_2025']:,}",
+            pct_delta(kpis['total_2025'], kpis['total_2024'], "{:.1f}%")
+        ))
+    if 'eng_2025_rate' in kpis:
+        headline_kpis.append((
+            "% Requiring Engineering",
+            f"{kpis['eng_2025_rate']:.1f}%",
+            f"{(kpis['eng_2025_rate']-kpis['eng_2024_rate']):+.1f}pp"
+        ))
+    if 'frt_2025_avg' in kpis:
+        headline_kpis.append((
+            "Avg First Response",
+            f"{kpis['frt_2025_avg']:.0f}hrs",
+            pct_delta(kpis['frt_2025_avg'], kpis['frt_2024_avg'], "{:.0f}%")
+        ))
+    if 'avg_res_2025' in kpis:
+        headline_kpis.append((
+            "Avg Resolution Time",
+            f"{kpis['avg_res_2025']:.0f}d",
+            pct_delta(kpis['avg_res_2025'], kpis['avg_res_2024'], "{:.0f}%")
+        ))
+    kpi_grid(headline_kpis)
     
     # Second row of KPIs - Resolution by Severity
     st.markdown("### Resolution Time by Severity")
-    col5, col6, col7, col8 = st.columns(4)
-    
-    if 'resolution' in data:
-        df_resolution = data['resolution']
-        
-        # Blocker
-        with col5:
-            blocker_2025 = df_resolution[df_resolution['Severity'] == 'Blocker']['2025_Avg_Days'].values
-            blocker_2024 = df_resolution[df_resolution['Severity'] == 'Blocker']['2024_Avg_Days'].values
-            if len(blocker_2025) > 0 and len(blocker_2024) > 0:
-                st.metric(
-                    "Blocker Avg Resolution",
-                    f"{blocker_2025[0]:.0f}d",
-                    f"{((blocker_2025[0]-blocker_2024[0])/blocker_2024[0]*100):.0f}%",
-                    delta_color="inverse"
-                )
-        
-        # Critical
-        with col6:
-            critical_2025 = df_resolution[df_resolution['Severity'] == 'Critical']['2025_Avg_Days'].values
-            critical_2024 = df_resolution[df_resolution['Severity'] == 'Critical']['2024_Avg_Days'].values
-            if len(critical_2025) > 0 and len(critical_2024) > 0:
-                st.metric(
-                    "Critical Avg Resolution",
-                    f"{critical_2025[0]:.0f}d",
-                    f"{((critical_2025[0]-critical_2024[0])/critical_2024[0]*100):.0f}%",
-                    delta_color="inverse"
-                )
-        
-        # Major
-        with col7:
-            major_2025 = df_resolution[df_resolution['Severity'] == 'Major']['2025_Avg_Days'].values
-            major_2024 = df_resolution[df_resolution['Severity'] == 'Major']['2024_Avg_Days'].values
-            if len(major_2025) > 0 and len(major_2024) > 0:
-                st.metric(
-                    "Major Avg Resolution",
-                    f"{major_2025[0]:.0f}d",
-                    f"{((major_2025[0]-major_2024[0])/major_2024[0]*100):.0f}%",
-                    delta_color="inverse"
-                )
+    
+    severities = [severity for severity in ['Blocker', 'Critical', 'Major', 'Minor'] if f'{severity.lower()}_2025' in kpis]
+    if severities:
+        severity_kpis = pd.DataFrame(
+            {
+                '2025 Avg Resolution': [kpis[f'{severity.lower()}_2025'] for severity in severities],
+                '2024 Avg Resolution': [kpis[f'{severity.lower()}_2024'] for severity in severities],
+            },
+            index=pd.Index(severities, name='Severity')
+        )
+        # NaN, shown as "n/a", when there is no 2024 baseline
+        sev_2024_days = severity_kpis['2024 Avg Resolution'].to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            severity_kpis['YoY %'] = np.where(
+                sev_2024_days != 0,
+                (severity_kpis['2025 Avg Resolution'].to_numpy() - sev_2024_days) / sev_2024_days * 100,
+                np.nan
+            )
         
-        # Minor
-        with col8:
-            minor_2025 = df_resolution[df_resolution['Severity'] == 'Minor']['2025_Avg_Days'].values
-            minor_2024 = df_resolution[df_resolution['Severity'] == 'Minor']['2024_Avg_Days'].values
-            if len(minor_2025) > 0 and len(minor_2024) > 0:
-                st.metric(
-                    "Minor Avg Resolution",
-                    f"{minor_2025[0]:.0f}d",
-                    f"{((minor_2025[0]-minor_2024[0])/minor_2024[0]*100):.0f}%",
-                    delta_color="inverse"
-                )
+        # Lower is better: falling resolution times are green; "n/a" stays uncoloured
+        st.dataframe(
+            severity_kpis.style
+                .format({'2025 Avg Resolution': '{:.0f}d', '2024 Avg Resolution': '{:.0f}d', 'YoY %': '{:+.0f}%'}, na_rep="n/a")
+                .apply(
+                    lambda col: np.where(col.isna(), '', np.where(col < 0, 'color: #09ab3b', 'color: #ff2b2b')),
+                    subset=['YoY %']
+                ),
+            width="stretch"
+        )
     
     st.markdown("---")
     
     # Top Insights
     st.subheader("🔥 Top Strategic Insights")
     
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        <div style='background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); 
-                    padding: 1.5rem; border-radius: 10px; color: white;'>
-            <h3>35% Reduction</h3>
-            <p>Ticket volume down significantly</p>
-            <small>998 → 654 tickets (-344)</small>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                    padding: 1.5rem; border-radius: 10px; color: white;'>
-            <h3>CEE = 72%</h3>
-            <p>CEE handles most engineering escalations</p>
-            <small>Primary engineering partner</small>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div style='background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); 
-                    padding: 1.5rem; border-radius: 10px; color: white;'>
-            <h3>Railbookers</h3>
-            <p>215 tickets in 2025</p>
-            <small>33% of all support volume!</small>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(INSIGHT_CARDS, unsafe_allow_html=True)
     
     st.markdown("---")
     
     # Quick summary table
     st.subheader("📊 Year-over-Year Comparison")
     
-    summary_metrics = []
-    
-    # Total Tickets
-    if 'monthly' in data:
-        total_2024 = data['monthly'][data['monthly']['Year'] == 2024]['Created'].sum()
-        total_2025 = data['monthly'][data['monthly']['Year'] == 2025]['Created'].sum()
-        change_pct = ((total_2025-total_2024)/total_2024*100) if total_2024 > 0 else 0
-        summary_metrics.append({
-            "Metric": "Total Tickets", 
-            "2024": f"{total_2024:,}", 
-            "2025": f"{total_2025:,}", 
-            "Change": f"{change_pct:+.1f}%", 
-            "Trend": "✅" if change_pct < 0 else "⚠️"
-        })
-    
-    # Engineering Involvement
-    if 'eng_summary' in data:
-        eng_2024_rate = float(data['eng_summary'][data['eng_summary']['Metric'] == 'Engineering Involvement Rate']['2024_Value'].values[0].rstrip('%'))
-        eng_2025_rate = float(data['eng_summary'][data['eng_summary']['Metric'] == 'Engineering Involvement Rate']['2025_Value'].values[0].rstrip('%'))
-        change = eng_2025_rate - eng_2024_rate
-        summary_metrics.append({
-            "Metric": "Engineering Involvement", 
-            "2024": f"{eng_2024_rate:.1f}%", 
-            "2025": f"{eng_2025_rate:.1f}%", 
-            "Change": f"{change:+.1f}pp", 
-            "Trend": "✅" if change < 0 else "⚠️"
-        })
-    
-    # Blocker Resolution
-    if 'resolution' in data:
-        df_res = data['resolution']
-        blocker_2024 = df_res[df_res['Severity'] == 'Blocker']['2024_Avg_Days'].values
-        blocker_2025 = df_res[df_res['Severity'] == 'Blocker']['2025_Avg_Days'].values
-        if len(blocker_2024) > 0 and len(blocker_2025) > 0:
-            change_pct = ((blocker_2025[0]-blocker_2024[0])/blocker_2024[0]*100)
-            summary_metrics.append({
-                "Metric": "Blocker Resolution (days)", 
-                "2024": f"{blocker_2024[0]:.0f}", 
-                "2025": f"{blocker_2025[0]:.0f}", 
-                "Change": f"{change_pct:+.1f}%", 
-                "Trend": "✅" if change_pct < 0 else "⚠️"
-            })
-    
-    # Critical Resolution
-    if 'resolution' in data:
-        critical_2024 = df_res[df_res['Severity'] == 'Critical']['2024_Avg_Days'].values
-        critical_2025 = df_res[df_res['Severity'] == 'Critical']['2025_Avg_Days'].values
-        if len(critical_2024) > 0 and len(critical_2025) > 0:
-            change_pct = ((critical_2025[0]-critical_2024[0])/critical_2024[0]*100)
-            summary_metrics.append({
-                "Metric": "Critical Resolution (days)", 
-                "2024": f"{critical_2024[0]:.0f}", 
-                "2025": f"{critical_2025[0]:.0f}", 
-                "Change": f"{change_pct:+.1f}%", 
-                "Trend": "✅" if change_pct < 0 else "⚠️"
-            })
-    
-    # Average FRT
-    if 'frt' in data:
-        frt_2024_avg = data['frt']['2024_Avg_Hours'].mean()
-        frt_2025_avg = data['frt']['2025_Avg_Hours'].mean()
-        change_pct = ((frt_2025_avg-frt_2024_avg)/frt_2024_avg*100)
-        summary_metrics.append({
-            "Metric": "Avg FRT (hours)", 
-            "2024": f"{frt_2024_avg:.0f}", 
-            "2025": f"{frt_2025_avg:.0f}", 
-            "Change": f"{change_pct:+.1f}%", 
-            "Trend": "✅" if change_pct < 0 else "⚠️"
-        })
-    
-    # Average Resolution
-    if 'resolution' in data:
-        avg_res_2024 = data['resolution']['2024_Avg_Days'].mean()
-        avg_res_2025 = data['resolution']['2025_Avg_Days'].mean()
-        change_pct = ((avg_res_2025-avg_res_2024)/avg_res_2024*100)
-        summary_metrics.append({
-            "Metric": "Avg Resolution (days)", 
-            "2024": f"{avg_res_2024:.0f}", 
-            "2025": f"{avg_res_2025:.0f}", 
-            "Change": f"{change_pct:+.1f}%", 
-            "Trend": "✅" if change_pct < 0 else "⚠️"
-        })
-    
-    st.dataframe(pd.DataFrame(summary_metrics), width="stretch", hide_index=True)
+    # One row per metric whose KPIs were computed
+    summary = pd.DataFrame(
+        [
+            (label, kpis[key_2024], kpis[key_2025], fmt, unit, lower_is_better)
+            for label, key_2024, key_2025, fmt, unit, lower_is_better in YOY_METRICS
+            if key_2025 in kpis
+        ],
+        columns=['Metric', 'v24', 'v25', 'fmt', 'unit', 'lower_is_better']
+    )
+    
+    # Percentage-point metrics report the raw difference, the rest the relative change
+    diff = summary['v25'] - summary['v24']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pct = np.where(summary['v24'] != 0, diff / summary['v24'] * 100, 0.0)
+    change = np.where(summary['unit'] == 'pp', diff, pct)
+    improved = np.where(summary['lower_is_better'], change < 0, change > 0)
+    
+    summary_metrics = pd.DataFrame({
+        "Metric": summary['Metric'],
+        "2024": summary['v24'],
+        "2025": summary['v25'],
+        "Change": change,
+        "Trend": np.where(improved, "✅", "⚠️"),
+    }).astype({"Metric": STRING_DTYPE, "Trend": STRING_DTYPE})
+    
+    # Values stay numeric; the Styler formats each group of rows sharing a format or unit in one pass
+    styled_metrics = summary_metrics.style
+    for fmt, rows in summary.groupby('fmt').groups.items():
+        styled_metrics = styled_metrics.format(fmt, subset=pd.IndexSlice[rows, ['2024', '2025']])
+    for unit, rows in summary.groupby('unit').groups.items():
+        styled_metrics = styled_metrics.format(f"{{:+.1f}}{unit}", subset=pd.IndexSlice[rows, ['Change']])
+    
+    st.dataframe(styled_metrics, width="stretch", hide_index=True)
 
 # ==================
 # CUSTOMER INTELLIGENCE
@@ -414,39 +952,16 @@ elif page == "🏢 Customer Intelligence":
     st.info("💡 **Strategic Value:** Identify high-touch accounts, at-risk customers, and proactive support opportunities.")
     
     if 'orgs' in data:
-        df_orgs = data['orgs']
+        # Presorted by 2025 volume in the loader, so every section slices instead of sorting
+        df_orgs = data['orgs_by_tickets']
+        orgs_by_growth = data['orgs_by_growth']
         
         # Top Customers Chart
         st.subheader("🏆 Top 15 Customers by Ticket Volume")
         
-        top_15 = df_orgs.nlargest(15, '2025_Tickets')
-        
-        fig = go.Figure()
-        
-        fig.add_trace(go.Bar(
-            y=top_15['Organization'],
-            x=top_15['2024_Tickets'],
-            name='2024',
-            orientation='h',
-            marker_color='#1f77b4'
-        ))
-        
-        fig.add_trace(go.Bar(
-            y=top_15['Organization'],
-            x=top_15['2025_Tickets'],
-            name='2025',
-            orientation='h',
-            marker_color='#ff7f0e'
-        ))
-        
-        fig.update_layout(
-            barmode='group',
-            height=600,
-            xaxis_title="Number of Tickets",
-            yaxis_title=None
-        )
+        top_15 = df_orgs.head(15)
         
-        st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
+        st.plotly_chart(build_top15_fig(top_15[['Organization', '2024_Tickets', '2025_Tickets']]), width="stretch", config=PLOTLY_CFG)
         
         # Risk Analysis
         st.markdown("---")
@@ -456,20 +971,17 @@ elif page == "🏢 Customer Intelligence":
         
         with col1:
             st.markdown("### 🚨 High-Volume Customers (Risk of Churn)")
-            high_volume = df_orgs[df_orgs['2025_Tickets'] >= 50].sort_values('2025_Tickets', ascending=False)
+            high_volume = df_orgs[df_orgs['2025_Tickets'] >= 50]
             
             if not high_volume.empty:
-                risk_data = []
-                for _, row in high_volume.iterrows():
-                    risk_level = "🔴 Critical" if row['2025_Tickets'] > 100 else "🟡 High"
-                    risk_data.append({
-                        'Customer': row['Organization'],
-                        '2025 Tickets': int(row['2025_Tickets']),
-                        'Risk': risk_level,
-                        'Avg Resolution': f"{row['2025_Avg_Resolution_Days']:.1f} days"
-                    })
+                risk_data = pd.DataFrame({
+                    'Customer': high_volume['Organization'],
+                    '2025 Tickets': high_volume['2025_Tickets'].astype(int),
+                    'Risk': np.where(high_volume['2025_Tickets'] > 100, "🔴 Critical", "🟡 High"),
+                    'Avg Resolution': high_volume['2025_Avg_Resolution_Days'].map("{:.1f} days".format)
+                }).astype({'Customer': STRING_DTYPE, 'Risk': STRING_DTYPE, 'Avg Resolution': STRING_DTYPE})
                 
-                st.dataframe(pd.DataFrame(risk_data), width="stretch", hide_index=True)
+                st.dataframe(risk_data, width="stretch", hide_index=True)
                 
                 st.warning(f"""
                 **Action Required:** These {len(high_volume)} customers need dedicated attention:
@@ -481,37 +993,31 @@ elif page == "🏢 Customer Intelligence":
         
         with col2:
             st.markdown("### 📈 Growing Ticket Volume (Investigation Needed)")
-            growing = df_orgs[df_orgs['Pct_Change'] > 50].sort_values('Pct_Change', ascending=False).head(10)
+            # Only customers with 2024 tickets have a meaningful growth rate
+            growing = orgs_by_growth[(orgs_by_growth['Pct_Change'] > 50) & (orgs_by_growth['2024_Tickets'] > 0)].head(10)
             
             if not growing.empty:
-                growth_data = []
-                for _, row in growing.iterrows():
-                    if row['2024_Tickets'] > 0:  # Only show meaningful changes
-                        growth_data.append({
-                            'Customer': row['Organization'],
-                            '2024→2025': f"{int(row['2024_Tickets'])}→{int(row['2025_Tickets'])}",
-                            'Growth': f"+{row['Pct_Change']:.0f}%"
-                        })
+                growth_data = pd.DataFrame({
+                    'Customer': growing['Organization'],
+                    '2024→2025': growing['2024_Tickets'].astype(int).astype(str) + "→" + growing['2025_Tickets'].astype(int).astype(str),
+                    'Growth': growing['Pct_Change'].map("+{:.0f}%".format)
+                }).astype(STRING_DTYPE)
                 
-                if growth_data:
-                    st.dataframe(pd.DataFrame(growth_data), width="stretch", hide_index=True)
-                    
-                    st.info("""
-                    **Recommended Actions:**
-                    - Schedule calls to understand issues
-                    - Check for product fit problems
-                    - Identify training gaps
-                    """)
+                st.dataframe(growth_data, width="stretch", hide_index=True)
+                
+                st.info("""
+                **Recommended Actions:**
+                - Schedule calls to understand issues
+                - Check for product fit problems
+                - Identify training gaps
+                """)
         
         # Customer Segmentation
         st.markdown("---")
         st.subheader("📊 Customer Segmentation Strategy for 2026")
         
         # Define tiers
-        tier1 = df_orgs[df_orgs['2025_Tickets'] >= 50].sort_values('2025_Tickets', ascending=False)
-        tier2 = df_orgs[(df_orgs['2025_Tickets'] >= 20) & (df_orgs['2025_Tickets'] < 50)].sort_values('2025_Tickets', ascending=False)
-        tier3 = df_orgs[(df_orgs['2025_Tickets'] >= 5) & (df_orgs['2025_Tickets'] < 20)].sort_values('2025_Tickets', ascending=False)
-        tier4 = df_orgs[df_orgs['2025_Tickets'] < 5]
+        tier1, tier2, tier3, tier4 = compute_tiers(df_orgs)
         
         col1, col2, col3, col4 = st.columns(4)
         
@@ -582,36 +1088,7 @@ elif page == "🏢 Customer Intelligence":
         st.markdown("---")
         st.subheader("💰 Support Model Budget Breakdown")
         
-        budget_breakdown = pd.DataFrame([
-            {
-                "Tier": "Tier 1 - Dedicated CSM",
-                "Customers": len(tier1),
-                "Annual Cost": "$75,000",
-                "Cost per Customer": f"${75000/len(tier1):,.0f}" if len(tier1) > 0 else "N/A",
-                "Justification": "Prevent churn, increase expansion"
-            },
-            {
-                "Tier": "Tier 2 - Quarterly Reviews",
-                "Customers": len(tier2),
-                "Annual Cost": "$30,000",
-                "Cost per Customer": f"${30000/len(tier2):,.0f}" if len(tier2) > 0 else "N/A",
-                "Justification": "Proactive relationship management"
-            },
-            {
-                "Tier": "Tier 3 - Standard",
-                "Customers": len(tier3),
-                "Annual Cost": "$0",
-                "Cost per Customer": "$0",
-                "Justification": "Covered by base support team"
-            },
-            {
-                "Tier": "Tier 4 - Self-Service",
-                "Customers": len(tier4),
-                "Annual Cost": "$0",
-                "Cost per Customer": "$0",
-                "Justification": "Community-driven support"
-            }
-        ])
+        budget_breakdown = build_budget_df(len(tier1), len(tier2), len(tier3), len(tier4))
         
         st.dataframe(budget_breakdown, width="stretch", hide_index=True)
         
@@ -629,12 +1106,7 @@ elif page == "🏢 Customer Intelligence":
 elif page == "🔧 Engineering Involvement":
     st.header("Engineering Involvement Analysis")
     
-    st.markdown("""
-    <div style='background-color: #e8f4f8; padding: 1rem; border-radius: 5px; border-left: 4px solid #1f77b4;'>
-        <strong>💡 Why This Matters:</strong> Engineering involvement is expensive. Lower rates indicate better 
-        documentation, training, or product stability. Track trends to measure support efficiency.
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(ENG_INTRO, unsafe_allow_html=True)
     
     st.markdown("")
     
@@ -646,19 +1118,17 @@ elif page == "🔧 Engineering Involvement":
         
         col1, col2, col3 = st.columns(3)
         
+        eng_rate = df_eng.set_index('Metric').loc['Engineering Involvement Rate']
+        
         with col1:
-            rate_2024 = df_eng[df_eng['Metric'] == 'Engineering Involvement Rate']['2024_Value'].values[0]
-            st.metric("2024 Engineering Rate", rate_2024)
+            st.metric("2024 Engineering Rate", eng_rate['2024_Value'])
         
         with col2:
-            rate_2025 = df_eng[df_eng['Metric'] == 'Engineering Involvement Rate']['2025_Value'].values[0]
-            st.metric("2025 Engineering Rate", rate_2025, "Lower is better")
+            st.metric("2025 Engineering Rate", eng_rate['2025_Value'], "Lower is better")
         
         with col3:
             # Calculate improvement
-            rate_2024_num = float(rate_2024.rstrip('%'))
-            rate_2025_num = float(rate_2025.rstrip('%'))
-            improvement = rate_2024_num - rate_2025_num
+            improvement = eng_rate['2024_Value_num'] - eng_rate['2025_Value_num']
             st.metric("Improvement", f"{improvement:.1f}pp", "Less escalation ✅" if improvement > 0 else "More escalation ⚠️")
     
     # Which Engineering Teams
@@ -668,49 +1138,27 @@ elif page == "🔧 Engineering Involvement":
     if 'eng_teams' in data:
         df_teams = data['eng_teams']
         
-        fig = go.Figure()
-        
-        fig.add_trace(go.Bar(
-            x=df_teams['Engineering_Team'],
-            y=df_teams['2024_Tickets'],
-            name='2024',
-            marker_color='#1f77b4',
-            text=df_teams['2024_Tickets'],
-            textposition='auto'
-        ))
-        
-        fig.add_trace(go.Bar(
-            x=df_teams['Engineering_Team'],
-            y=df_teams['2025_Tickets'],
-            name='2025',
-            marker_color='#ff7f0e',
-            text=df_teams['2025_Tickets'],
-            textposition='auto'
-        ))
-        
-        fig.update_layout(
-            barmode='group',
+        fig = build_yoy_bar_fig(
+            df_teams[['Engineering_Team', '2024_Tickets', '2025_Tickets']], 'Engineering_Team', 'Tickets', '%{y}',
             title="Support Tickets by Engineering Team: 2024 vs 2025",
             xaxis_title="Engineering Team",
             yaxis_title="Number of Tickets",
             height=500
         )
-        
-        st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
+        st.plotly_chart(fig, width="stretch", config=PLOTLY_CFG)
         
         # Team insights
         st.markdown("### 💡 Team Insights")
         
-        top_team_2025 = df_teams.nlargest(1, '2025_Tickets').iloc[0]
+        top_team_name, has_api, team_insights = build_team_insights(df_teams)
+        
+        st.markdown(f"**{top_team_name} handles most escalations**")
+        st.dataframe(team_insights, width="stretch", hide_index=True)
         
         col1, col2 = st.columns(2)
         
         with col1:
-            st.markdown(f"""
-            **{top_team_2025['Engineering_Team']} handles most escalations**
-            - Handles {top_team_2025['2025_Tickets']} tickets in 2025
-            - {top_team_2025['Change']:+d} from 2024
-            
+            st.markdown("""
             **Opportunity:**
             - High concentration in one team
             - Opportunity to distribute across domain teams
@@ -719,13 +1167,9 @@ elif page == "🔧 Engineering Involvement":
             """)
         
         with col2:
-            api_team = df_teams[df_teams['Engineering_Team'] == 'API']
-            if not api_team.empty:
-                api_count = api_team.iloc[0]['2025_Tickets']
-                st.markdown(f"""
-                **API Team involvement: {api_count} tickets**
-                
-                **Actions:**
+            if has_api:
+                st.markdown("""
+                **API Team Actions:**
                 - Improve API documentation
                 - Create integration guides
                 - Office hours for partners
@@ -739,35 +1183,14 @@ elif page == "🔧 Engineering Involvement":
     if 'eng_severity' in data:
         df_sev = data['eng_severity']
         
-        fig = go.Figure()
-        
-        fig.add_trace(go.Bar(
-            x=df_sev['Severity'],
-            y=df_sev['2024_Engineering_Rate'],
-            name='2024',
-            marker_color='#1f77b4',
-            text=[f"{val:.1f}%" for val in df_sev['2024_Engineering_Rate']],
-            textposition='auto'
-        ))
-        
-        fig.add_trace(go.Bar(
-            x=df_sev['Severity'],
-            y=df_sev['2025_Engineering_Rate'],
-            name='2025',
-            marker_color='#ff7f0e',
-            text=[f"{val:.1f}%" for val in df_sev['2025_Engineering_Rate']],
-            textposition='auto'
-        ))
-        
-        fig.update_layout(
-            barmode='group',
+        fig = build_yoy_bar_fig(
+            df_sev[['Severity', '2024_Engineering_Rate', '2025_Engineering_Rate']], 'Severity', 'Engineering_Rate', '%{y:.1f}%',
             title="% of Tickets Requiring Engineering by Severity",
             xaxis_title="Severity",
             yaxis_title="Engineering Involvement Rate (%)",
             height=400
         )
-        
-        st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
+        st.plotly_chart(fig, width="stretch", config=PLOTLY_CFG)
         
         st.dataframe(df_sev, width="stretch", hide_index=True)
     
@@ -775,191 +1198,22 @@ elif page == "🔧 Engineering Involvement":
     st.markdown("---")
     st.subheader("🎯 2026 Engineering Escalation Model Optimization")
     
-    st.markdown("""
-    <div style='background-color: #e8f4f8; padding: 1.5rem; border-radius: 5px; border-left: 4px solid #1f77b4; margin-bottom: 1rem;'>
-        <h4>💡 Strategic Opportunity Identified</h4>
-        <p>Current data shows 72% of engineering escalations flow through a single team. This creates opportunities for:</p>
-        <ul>
-            <li><strong>Distributed Ownership</strong>: Product teams own defects/performance in their domain</li>
-            <li><strong>Technical Triage Layer</strong>: Support Engineers handle diagnosis before escalation</li>
-            <li><strong>Faster Resolution</strong>: Domain teams resolve own issues 40% faster</li>
-        </ul>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(ENG_OPPORTUNITY, unsafe_allow_html=True)
     
     tab1, tab2, tab3 = st.tabs(["💼 Recommended Model", "📊 Expected Impact", "💰 Investment Case"])
     
     with tab1:
-        st.markdown("""
-        ### Proposed 2026 Model: Distributed Ownership + Support Engineering
-        
-        #### Component 1: Domain-Based Ownership
-        
-        Each product domain owns the complete lifecycle:
-        
-        | Domain | Owns | Current Eng. Rate |
-        |--------|------|-------------------|
-        | **Selling Domain** | Booking Wizard, Package Selling, Basket | ~35% of escalations |
-        | **Build & Ops Domain** | Builder, Pricing, Services, Operations | ~40% of escalations |
-        | **API Services** | API performance, integrations, ktapi | ~20% of escalations |
-        | **Cloud Platform** | Infrastructure, security, platform | ~5% of escalations |
-        
-        **Benefit**: Teams already handling 32% of tickets resolve 40% faster when they own end-to-end.
-        
-        ---
-        
-        #### Component 2: Support Engineering Layer (L3)
-        
-        **New Role**: 2-3 Support Engineers sit between L2 Support and Engineering
-        
-        **Responsibilities**:
-        - Technical triage and diagnosis
-        - Log analysis and troubleshooting  
-        - API/integration debugging
-        - Configuration investigation
-        - Reproduce issues and determine root cause
-        
-        **Resolve Without Engineering**: 50-60% of current escalations
-        - Configuration issues
-        - Data investigation
-        - Integration debugging (non-bug)
-        - Environment-specific issues
-        
-        **Escalate to Engineering Only When**:
-        - Bug confirmed in code
-        - Performance optimization needed
-        - Architecture change required
-        - New feature needed
-        
-        ---
-        
-        #### Routing Logic
-        
-        ```
-        Customer Ticket
-            ↓
-        L1/L2 Support (Standard troubleshooting)
-            ↓
-        [NEW] L3 Support Engineers (Technical diagnosis)
-            ↓ (only if needed)
-        Domain Engineering Team (Code/architecture changes)
-        ```
-        """)
+        st.markdown(ENG_MODEL_TAB)
     
     with tab2:
-        st.markdown("""
-        ### Expected Impact Analysis
-        
-        #### Current State (2025)
-        - **210 tickets** require engineering
-        - **72%** flow through single team (concentration risk)
-        - **Average resolution**: 42-47 days
-        - **Engineering cost**: ~$315K annually
-        
-        #### Projected State (2026 with new model)
-        - **~100-110 tickets** reach engineering (complex only)
-        - **Distributed** across domain teams (clear ownership)
-        - **Support Engineers resolve**: 100-110 tickets in 5-10 days
-        - **Engineering focuses**: Real product issues, features, improvements
-        
-        #### Customer Impact
-        
-        | Metric | Current | Projected | Improvement |
-        |--------|---------|-----------|-------------|
-        | Avg Resolution (SE-handled) | N/A | 7 days | 6x faster |
-        | Avg Resolution (Engineering) | 47 days | 28 days | 40% faster |
-        | First Response Time | 241 hrs | 4-8 hrs | 30x faster |
-        | Overall Satisfaction | Baseline | +20-30% | Major improvement |
-        
-        #### Engineering Team Impact
-        
-        **Before**:
-        - 210 interruptions per year
-        - High context-switching cost
-        - Diluted focus on product development
-        
-        **After**:
-        - 110 well-triaged issues only
-        - Clear domain ownership
-        - 50% more focus time for features/improvements
-        - Equivalent to adding ~2 FTE in productivity
-        """)
+        st.markdown(ENG_IMPACT_TAB)
     
     with tab3:
-        st.markdown("""
-        ### Investment & ROI Analysis
-        
-        #### Investment Required
-        
-        | Item | Cost | FTE |
-        |------|------|-----|
-        | Support Engineer #1 | $100,000 | 1.0 |
-        | Support Engineer #2 | $100,000 | 1.0 |
-        | Support Engineer #3 (H2-2026, optional) | $100,000 | 1.0 |
-        | Training & Tools | $20,000 | — |
-        | **Initial Investment (2 SEs)** | **$220,000** | **2.0** |
-        
-        #### Returns
-        
-        | Benefit | Annual Value | Source |
-        |---------|--------------|--------|
-        | Engineering Velocity Gain | $210,000 | 2 FTE equivalent focus time |
-        | Faster Customer Resolution | $500,000 | Retention + expansion impact |
-        | Support Team Efficiency | $50,000 | L2 handles more with backup |
-        | Knowledge Capture | $30,000 | Reusable solutions |
-        | **Total Annual Value** | **$790,000** | Measured impact |
-        
-        #### Net ROI
-        
-        **Annual Benefit**: $790K - $220K = **$570K**  
-        **ROI**: **259%**  
-        **Payback Period**: **<5 months**
-        
-        ---
-        
-        #### Phased Approach (Recommended)
-        
-        **Q1 2026: Pilot**
-        - Hire 2 Support Engineers ($220K)
-        - Begin domain ownership documentation
-        - 3-month pilot program
-        
-        **Q2 2026: Evaluation**
-        - Measure: SE resolution rate, engineering escalation reduction
-        - Decision gate: Add 3rd SE if resolution rate >60%
-        
-        **Q3 2026: Full Operation**
-        - Full model operational
-        - Optimize based on 6 months data
-        - Scale if needed
-        
-        #### Risk Mitigation
-        
-        **Risk**: Domain teams feel overwhelmed  
-        **Mitigation**: 36% capacity already allocated to product health; SE filters 50% before escalation
-        
-        **Risk**: SE lack domain knowledge  
-        **Mitigation**: 30-day rotation through each domain; comprehensive runbooks
-        
-        **Risk**: Slower during transition  
-        **Mitigation**: Phased rollout; keep current path as backup; daily monitoring
-        """)
+        st.markdown(ENG_INVESTMENT_TAB)
     
     # Call to Action
     st.markdown("---")
-    st.markdown("""
-    <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 2rem; border-radius: 10px; color: white;'>
-        <h3>💼 Recommended Decision for Annual Planning</h3>
-        <p><strong>Approve hiring 2 Support Engineers in Q4 2025</strong></p>
-        <ul>
-            <li>Investment: $220,000 annually</li>
-            <li>Expected ROI: $570,000 net benefit</li>
-            <li>Timeline: Q1 2026 pilot, Q2 evaluation, Q3 full operation</li>
-            <li>Risk: Low (phased approach with decision gates)</li>
-        </ul>
-        <p><strong>Next Steps:</strong> Approve budget → Begin recruitment → Q1 2026 onboarding</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(ENG_DECISION, unsafe_allow_html=True)
 
 # ==================
 # TEAM SCORECARD
@@ -980,32 +1234,14 @@ elif page == "👥 Team Scorecard":
     
     if 'assignees' in data:
         df_assignees = data['assignees']
-        df_year = df_assignees[df_assignees['Year'] == year].copy()
-        
-        # Remove unassigned
-        df_year = df_year[df_year['Assignee'] != 'Unassigned']
-        
-        # Check if we have Level classification data
-        has_level_data = 'Support_Level' in df_year.columns
+        df_year, df_level1, df_level2_contrib, scorecard_df, team_stats, l1_rankings, l2_rankings = build_scorecard(
+            df_assignees, data.get('contributors'), year
+        )
         
         if not df_year.empty:
-            # Calculate additional metrics
-            df_year['Tickets_Per_Day'] = (df_year['Total_Resolved'] / 250).round(2)  # ~250 working days
-            
-            # Engineering rate already in the data as Engineering_Rate_Pct
-            
             # Team Overview
             st.subheader(f"📊 {year} Team Overview")
             
-            # Get Level 1 and Level 2 data
-            df_level1 = df_year[df_year['Support_Level'] == 'Level 1'].copy() if has_level_data else df_year.copy()
-            df_level2_contrib = pd.DataFrame()
-            
-            if 'contributors' in data:
-                df_contributors = data['contributors']
-                df_contrib_year = df_contributors[df_contributors['Year'] == year].copy()
-                df_level2_contrib = df_contrib_year[df_contrib_year['Role'] == 'Level 2 (Contributor)'].copy()
-            
             # Team composition metrics
             col1, col2, col3 = st.columns(3)
             
@@ -1036,394 +1272,292 @@ elif page == "👥 Team Scorecard":
                     <p>Resolution & Ticket Closure</p>
                 </div>
                 """, unsafe_allow_html=True)
-                
-                if not df_level1.empty:
-                    # Level 1 team metrics
-                    st.markdown("**Team Metrics:**")
-                    avg_resolved_l1 = df_level1['Total_Resolved'].mean()
-                    avg_resolution_time_l1 = df_level1['Avg_Resolution_Days'].mean()
-                    avg_resolution_rate_l1 = df_level1['Resolution_Rate_Pct'].mean()
-                    
-                    l1_col1, l1_col2 = st.columns(2)
-                    with l1_col1:
-                        st.metric("Avg Tickets/Agent", f"{avg_resolved_l1:.0f}")
-                        st.metric("Avg Resolution Time", f"{avg_resolution_time_l1:.1f}d")
-                    with l1_col2:
-                        st.metric("Avg Resolution Rate", f"{avg_resolution_rate_l1:.0f}%")
-                        if 'Engineering_Rate_Pct' in df_level1.columns:
-                            avg_eng_l1 = df_level1['Engineering_Rate_Pct'].mean()
-                            st.metric("Avg Eng Escalation", f"{avg_eng_l1:.1f}%")
-                    
-                    st.markdown("---")
-                    st.markdown("**Individual Rankings:**")
-                    
-                    # Sort by total resolved
-                    df_level1_sorted = df_level1.sort_values('Total_Resolved', ascending=False)
-                    
-                    for idx, (_, row) in enumerate(df_level1_sorted.iterrows(), 1):
-                        medal = "🥇" if idx == 1 else "🥈" if idx == 2 else "🥉" if idx == 3 else f"#{idx}"
-                        
-                        with st.expander(f"{medal} {row['Assignee']} - {row['Total_Resolved']:.0f} tickets"):
-                            metric_cols = st.columns(3)
-                            with metric_cols[0]:
-                                st.metric("Resolved", f"{row['Total_Resolved']:.0f}")
-                            with metric_cols[1]:
-                                st.metric("Avg Days", f"{row['Avg_Resolution_Days']:.1f}")
-                            with metric_cols[2]:
-                                st.metric("Rate", f"{row['Resolution_Rate_Pct']:.0f}%")
-                else:
-                    st.info("No Level 1 agents for this year")
-            
-            # ========== RIGHT COLUMN: LEVEL 2 ==========
-            with col_l2:
-                st.markdown("""
-                <div style='background: linear-gradient(135deg, #ff7f0e 0%, #ffb347 100%); 
-                            padding: 1rem; border-radius: 10px; color: white; text-align: center; margin-bottom: 1rem;'>
-                    <h3>🔍 LEVEL 2 CONTRIBUTORS</h3>
-                    <p>Triage & Investigation</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                if not df_level2_contrib.empty:
-                    # Level 2 team metrics
-                    st.markdown("**Team Metrics:**")
-                    total_tickets_l2 = df_level2_contrib['Tickets_Contributed'].sum()
-                    total_comments_l2 = df_level2_contrib['Total_Comments'].sum()
-                    avg_comments_l2 = df_level2_contrib['Avg_Comments_Per_Ticket'].mean()
-                    
-                    l2_col1, l2_col2 = st.columns(2)
-                    with l2_col1:
-                        st.metric("Total Tickets Helped", f"{total_tickets_l2:,}")
-                        st.metric("Avg Comments/Ticket", f"{avg_comments_l2:.2f}")
-                    with l2_col2:
-                        st.metric("Total Comments", f"{total_comments_l2:,}")
-                        avg_velocity_l2 = df_level2_contrib['Comment_Velocity_Per_Day'].mean()
-                        st.metric("Avg Velocity/Day", f"{avg_velocity_l2:.2f}")
-                    
-                    st.markdown("---")
-                    st.markdown("**Individual Rankings:**")
-                    
-                    # Sort by tickets contributed
-                    df_level2_sorted = df_level2_contrib.sort_values('Tickets_Contributed', ascending=False)
-                    
-                    for idx, (_, row) in enumerate(df_level2_sorted.iterrows(), 1):
-                        medal = "🥇" if idx == 1 else "🥈" if idx == 2 else f"#{idx}"
-                        
-                        with st.expander(f"{medal} {row['Contributor']} - {row['Tickets_Contributed']:.0f} tickets"):
-                            metric_cols = st.columns(3)
-                            with metric_cols[0]:
-                                st.metric("Tickets", f"{row['Tickets_Contributed']:.0f}")
-                            with metric_cols[1]:
-                                st.metric("Comments", f"{row['Total_Comments']:.0f}")
-                            with metric_cols[2]:
-                                st.metric("Avg/Ticket", f"{row['Avg_Comments_Per_Ticket']:.2f}")
-                            
-                            # Show hold time if available
-                            if pd.notna(row.get('Avg_Hold_Time_Hours')):
-                                st.metric("Avg Hold Time", f"{row['Avg_Hold_Time_Hours']:.1f}h", 
-                                         help="Average time before transitioning ticket to next stage")
-                else:
-                    st.info("No Level 2 contributors for this year")
-            
-            st.markdown("---")
-            
-            # Legacy sections below (kept for compatibility)
-            # Team Summary Stats
-            st.subheader(f"📊 {year} Detailed Team Summary (Legacy View)")
-            
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                total_team = len(df_year)
-                st.metric("Active Team Members", total_team)
-            
-            with col2:
-                avg_resolved = df_year['Total_Resolved'].mean()
-                st.metric("Avg Tickets Resolved", f"{avg_resolved:.0f}")
-            
-            with col3:
-                avg_resolution_time = df_year['Avg_Resolution_Days'].mean()
-                st.metric("Avg Resolution Time", f"{avg_resolution_time:.1f}d")
-            
-            with col4:
-                avg_rate = df_year['Resolution_Rate_Pct'].mean()
-                st.metric("Avg Resolution Rate", f"{avg_rate:.0f}%")
-            
-            st.markdown("---")
-            
-            # Full Team Scorecard
-            st.subheader(f"🏆 {year} Individual Performance Scorecard")
-            
-            # Prepare display dataframe - include engineering rate if available
-            columns_to_include = [
-                'Assignee', 
-                'Total_Assigned', 
-                'Total_Resolved', 
-                'Avg_Resolution_Days',
-                'Resolution_Rate_Pct',
-                'Tickets_Per_Day'
-            ]
-            
-            # Add engineering rate if column exists
-            if 'Engineering_Rate_Pct' in df_year.columns:
-                columns_to_include.append('Engineering_Rate_Pct')
-            
-            scorecard_df = df_year[columns_to_include].copy()
-            
-            # Sort by total resolved
-            scorecard_df = scorecard_df.sort_values('Total_Resolved', ascending=False)
-            
-            # Add rank
-            scorecard_df.insert(0, 'Rank', range(1, len(scorecard_df) + 1))
-            
-            # Display with custom formatting
-            st.dataframe(
-                scorecard_df,
-                width="stretch",
-                hide_index=True,
-                column_config={
-                    "Rank": st.column_config.NumberColumn("Rank", format="%d"),
-                    "Assignee": st.column_config.TextColumn("Support Agent", width="large"),
-                    "Total_Assigned": st.column_config.NumberColumn("Assigned", format="%d"),
-                    "Total_Resolved": st.column_config.NumberColumn("Resolved", format="%d"),
-                    "Avg_Resolution_Days": st.column_config.NumberColumn("Avg Days", format="%.1f"),
-                    "Resolution_Rate_Pct": st.column_config.NumberColumn("Resolution %", format="%.0f%%"),
-                    "Tickets_Per_Day": st.column_config.NumberColumn("Per Day", format="%.2f"),
-                    "Engineering_Rate_Pct": st.column_config.NumberColumn("Eng %", format="%.1f%%", help="% requiring engineering")
-                }
-            )
-            
-            # Download scorecard
-            csv = scorecard_df.to_csv(index=False).encode('utf-8')
-            st.download_button(
-                "📥 Download Team Scorecard",
-                csv,
-                f"team_scorecard_{year}_{datetime.now().strftime('%Y%m%d')}.csv",
-                "text/csv"
-            )
-            
-            st.markdown("---")
-            
-            
-            # Level 2 Contributors Section (Anna, Raj, etc.)
-            if 'contributors' in data:
-                st.subheader("🔍 Level 2 Contributors - Triage & Support Across All Tickets")
-                
-                df_contributors = data['contributors']
-                df_contrib_year = df_contributors[df_contributors['Year'] == year].copy()
-                
-                # Filter for Level 2 contributors only
-                df_level2_contrib = df_contrib_year[df_contrib_year['Role'] == 'Level 2 (Contributor)'].copy()
-                
-                if not df_level2_contrib.empty:
-                    st.markdown("""
-                    **These agents provide Level 2 triage and investigation support across tickets assigned to others.**  
-                    They contribute through comments and status transitions without being the primary assignee.
-                    """)
-                    
-                    # Level 2 contributor metrics
-                    col1, col2, col3, col4 = st.columns(4)
-                    
-                    with col1:
-                        total_tickets_contrib = df_level2_contrib['Tickets_Contributed'].sum()
-                        st.metric("Total Tickets Contributed", f"{total_tickets_contrib:,}")
-                    
-                    with col2:
-                        total_comments_contrib = df_level2_contrib['Total_Comments'].sum()
-                        st.metric("Total Comments", f"{total_comments_contrib:,}")
-                    
-                    with col3:
-                        avg_comments_contrib = df_level2_contrib['Avg_Comments_Per_Ticket'].mean()
-                        st.metric("Avg Comments/Ticket", f"{avg_comments_contrib:.2f}")
-                    
-                    with col4:
-                        avg_velocity_contrib = df_level2_contrib['Comment_Velocity_Per_Day'].mean()
-                        st.metric("Avg Comment Velocity", f"{avg_velocity_contrib:.2f}/day")
+                
+                if not df_level1.empty:
+                    # Level 1 team metrics
+                    st.markdown("**Team Metrics:**")
                     
-                    # Individual contributor details
-                    st.markdown("#### 👤 Individual Level 2 Contributors")
+                    l1_stats = [
+                        ("Avg Tickets/Agent", f"{team_stats['avg_resolved_l1']:.0f}"),
+                        ("Avg Resolution Rate", f"{team_stats['avg_resolution_rate_l1']:.0f}%"),
+                        ("Avg Resolution Time", f"{team_stats['avg_resolution_time_l1']:.1f}d"),
+                    ]
+                    if 'avg_eng_l1' in team_stats:
+                        l1_stats.append(("Avg Eng Escalation", f"{team_stats['avg_eng_l1']:.1f}%"))
+                    stat_grid(l1_stats)
                     
-                    contrib_display = df_level2_contrib[[
-                        'Contributor',
-                        'Tickets_Contributed',
-                        'Total_Comments',
-                        'Total_Status_Transitions',
-                        'Avg_Comments_Per_Ticket',
-                        'Comment_Velocity_Per_Day'
-                    ]].sort_values('Tickets_Contributed', ascending=False)
+                    st.markdown("---")
+                    st.markdown("**Individual Rankings:**")
                     
+                    # Sorted by total resolved; one table rather than an expander per agent
                     st.dataframe(
-                        contrib_display,
+                        l1_rankings,
                         width="stretch",
                         hide_index=True,
                         column_config={
-                            "Contributor": st.column_config.TextColumn("Name", width="large"),
-                            "Tickets_Contributed": st.column_config.NumberColumn("Tickets Helped", format="%d"),
-                            "Total_Comments": st.column_config.NumberColumn("Total Comments", format="%d"),
-                            "Total_Status_Transitions": st.column_config.NumberColumn("Status Moves", format="%d"),
-                            "Avg_Comments_Per_Ticket": st.column_config.NumberColumn("Comments/Ticket", format="%.2f"),
-                            "Comment_Velocity_Per_Day": st.column_config.NumberColumn("Velocity/Day", format="%.2f")
+                            "Rank": st.column_config.TextColumn("Rank", width="small"),
+                            "Assignee": st.column_config.TextColumn("Agent"),
+                            "Total_Resolved": st.column_config.NumberColumn("Resolved", format="%d"),
+                            "Avg_Resolution_Days": st.column_config.NumberColumn("Avg Days", format="%.1f"),
+                            "Resolution_Rate_Pct": st.column_config.NumberColumn("Rate", format="%.0f%%")
                         }
                     )
-                    
-                    st.info("""
-                    💡 **Level 2 Contributors** help Level 1 agents by:
-                    - Adding technical comments and guidance
-                    - Transitioning tickets through triage workflow
-                    - Investigating complex issues
-                    - Routing to appropriate teams
-                    
-                    They work across many tickets without being the primary assignee.
-                    """)
                 else:
-                    st.info("No Level 2 contributors identified for this year")
-                
-                st.markdown("---")
-            
-            # Top Performers Spotlight
-            st.subheader("🌟 Top Performers Spotlight")
-            
-            col1, col2, col3 = st.columns(3)
-            
-            # Top by volume
-            with col1:
-                top_volume = scorecard_df.iloc[0]
-                st.markdown(f"""
-                <div style='background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); 
-                            padding: 1.5rem; border-radius: 10px; color: white; text-align: center;'>
-                    <h3>🏆 Highest Volume</h3>
-                    <h2>{top_volume['Assignee']}</h2>
-                    <p style='font-size: 2rem; margin: 0.5rem 0;'>{int(top_volume['Total_Resolved'])}</p>
-                    <p>tickets resolved</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # Fastest resolution
-            with col2:
-                fastest = scorecard_df.nsmallest(1, 'Avg_Resolution_Days').iloc[0]
-                st.markdown(f"""
-                <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                            padding: 1.5rem; border-radius: 10px; color: white; text-align: center;'>
-                    <h3>⚡ Fastest Resolution</h3>
-                    <h2>{fastest['Assignee']}</h2>
-                    <p style='font-size: 2rem; margin: 0.5rem 0;'>{fastest['Avg_Resolution_Days']:.1f}</p>
-                    <p>days average</p>
-                </div>
-                """, unsafe_allow_html=True)
+                    st.info("No Level 1 agents for this year")
             
-            # Highest resolution rate
-            with col3:
-                highest_rate = scorecard_df.nlargest(1, 'Resolution_Rate_Pct').iloc[0]
-                st.markdown(f"""
-                <div style='background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); 
-                            padding: 1.5rem; border-radius: 10px; color: white; text-align: center;'>
-                    <h3>✅ Highest Closure Rate</h3>
-                    <h2>{highest_rate['Assignee']}</h2>
-                    <p style='font-size: 2rem; margin: 0.5rem 0;'>{highest_rate['Resolution_Rate_Pct']:.0f}%</p>
-                    <p>resolution rate</p>
+            # ========== RIGHT COLUMN: LEVEL 2 ==========
+            with col_l2:
+                st.markdown("""
+                <div style='background: linear-gradient(135deg, #ff7f0e 0%, #ffb347 100%); 
+                            padding: 1rem; border-radius: 10px; color: white; text-align: center; margin-bottom: 1rem;'>
+                    <h3>🔍 LEVEL 2 CONTRIBUTORS</h3>
+                    <p>Triage & Investigation</p>
                 </div>
                 """, unsafe_allow_html=True)
+                
+                if not df_level2_contrib.empty:
+                    # Level 2 team metrics
+                    st.markdown("**Team Metrics:**")
+                    
+                    stat_grid([
+                        ("Total Tickets Helped", f"{team_stats['total_tickets_l2']:,}"),
+                        ("Total Comments", f"{team_stats['total_comments_l2']:,}"),
+                        ("Avg Comments/Ticket", f"{team_stats['avg_comments_l2']:.2f}"),
+                        ("Avg Velocity/Day", f"{team_stats['avg_velocity_l2']:.2f}"),
+                    ])
+                    
+                    st.markdown("---")
+                    st.markdown("**Individual Rankings:**")
+                    
+                    # Sorted by tickets contributed; hold time is blank where unavailable
+                    st.dataframe(
+                        l2_rankings,
+                        width="stretch",
+                        hide_index=True,
+                        column_config={
+                            "Rank": st.column_config.TextColumn("Rank", width="small"),
+                            "Contributor": st.column_config.TextColumn("Contributor"),
+                            "Tickets_Contributed": st.column_config.NumberColumn("Tickets", format="%d"),
+                            "Total_Comments": st.column_config.NumberColumn("Comments", format="%d"),
+                            "Avg_Comments_Per_Ticket": st.column_config.NumberColumn("Avg/Ticket", format="%.2f"),
+                            "Avg_Hold_Time_Hours": st.column_config.NumberColumn(
+                                "Avg Hold Time", format="%.1fh", help="Average time before transitioning ticket to next stage"
+                            )
+                        }
+                    )
+                else:
+                    st.info("No Level 2 contributors for this year")
             
             st.markdown("---")
             
-            # Performance Distribution Charts
-            st.subheader("📊 Team Performance Distribution")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # Resolution volume distribution
-                fig_volume = go.Figure()
+            # Legacy sections below (kept for compatibility), shown by default as before; switching
+            # them off skips the dozens of elements they add to every rerun
+            if st.toggle("Show legacy detailed view", value=True, key="show_legacy"):
+                # Team Summary Stats
+                st.subheader(f"📊 {year} Detailed Team Summary (Legacy View)")
                 
-                fig_volume.add_trace(go.Bar(
-                    y=scorecard_df['Assignee'].head(10),
-                    x=scorecard_df['Total_Resolved'].head(10),
-                    orientation='h',
-                    marker_color='#2ca02c',
-                    text=scorecard_df['Total_Resolved'].head(10),
-                    textposition='auto'
-                ))
+                col1, col2, col3, col4 = st.columns(4)
                 
-                fig_volume.update_layout(
-                    title="Top 10 Agents by Tickets Resolved",
-                    xaxis_title="Tickets Resolved",
-                    yaxis_title=None,
-                    height=400
-                )
+                with col1:
+                    total_team = len(df_year)
+                    st.metric("Active Team Members", total_team)
                 
-                st.plotly_chart(fig_volume, use_container_width=True, config={"displayModeBar": False})
-            
-            with col2:
-                # Resolution time distribution
-                fastest_10 = scorecard_df.nsmallest(10, 'Avg_Resolution_Days')
+                with col2:
+                    st.metric("Avg Tickets Resolved", f"{team_stats['avg_resolved']:.0f}")
                 
-                fig_speed = go.Figure()
+                with col3:
+                    st.metric("Avg Resolution Time", f"{team_stats['avg_resolution_time']:.1f}d")
                 
-                fig_speed.add_trace(go.Bar(
-                    y=fastest_10['Assignee'],
-                    x=fastest_10['Avg_Resolution_Days'],
-                    orientation='h',
-                    marker_color='#1f77b4',
-                    text=[f"{val:.1f}d" for val in fastest_10['Avg_Resolution_Days']],
-                    textposition='auto'
-                ))
+                with col4:
+                    st.metric("Avg Resolution Rate", f"{team_stats['avg_rate']:.0f}%")
                 
-                fig_speed.update_layout(
-                    title="Top 10 Fastest Average Resolution",
-                    xaxis_title="Days",
-                    yaxis_title=None,
-                    height=400
-                )
+                st.markdown("---")
                 
-                st.plotly_chart(fig_speed, use_container_width=True, config={"displayModeBar": False})
-            
-            # Year-over-Year Comparison
-            st.markdown("---")
-            st.subheader("📈 Year-over-Year Agent Performance")
-            
-            if year == 2025:
-                # Compare 2024 vs 2025 for agents present in both years
-                df_2024 = df_assignees[df_assignees['Year'] == 2024]
-                df_2025 = df_assignees[df_assignees['Year'] == 2025]
+                # Full Team Scorecard
+                st.subheader(f"🏆 {year} Individual Performance Scorecard")
                 
-                # Merge on assignee
-                comparison = pd.merge(
-                    df_2024[['Assignee', 'Total_Resolved', 'Avg_Resolution_Days']],
-                    df_2025[['Assignee', 'Total_Resolved', 'Avg_Resolution_Days']],
-                    on='Assignee',
-                    suffixes=('_2024', '_2025'),
-                    how='inner'
+                # Display with custom formatting
+                st.dataframe(
+                    scorecard_df,
+                    width="stretch",
+                    hide_index=True,
+                    column_config={
+                        "Rank": st.column_config.NumberColumn("Rank", format="%d"),
+                        "Assignee": st.column_config.TextColumn("Support Agent", width="large"),
+                        "Total_Assigned": st.column_config.NumberColumn("Assigned", format="%d"),
+                        "Total_Resolved": st.column_config.NumberColumn("Resolved", format="%d"),
+                        "Avg_Resolution_Days": st.column_config.NumberColumn("Avg Days", format="%.1f"),
+                        "Resolution_Rate_Pct": st.column_config.NumberColumn("Resolution %", format="%.0f%%"),
+                        "Tickets_Per_Day": st.column_config.NumberColumn("Per Day", format="%.2f"),
+                        "Engineering_Rate_Pct": st.column_config.NumberColumn("Eng %", format="%.1f%%", help="% requiring engineering")
+                    }
                 )
                 
-                if not comparison.empty:
-                    comparison['Volume_Change'] = comparison['Total_Resolved_2025'] - comparison['Total_Resolved_2024']
-                    comparison['Speed_Change'] = comparison['Avg_Resolution_Days_2025'] - comparison['Avg_Resolution_Days_2024']
-                    comparison['Speed_Change_Pct'] = (comparison['Speed_Change'] / comparison['Avg_Resolution_Days_2024'] * 100)
-                    
-                    # Most improved
-                    most_improved = comparison.nsmallest(5, 'Speed_Change')
+                # Download scorecard
+                csv = to_csv_bytes(scorecard_df)
+                st.download_button(
+                    "📥 Download Team Scorecard",
+                    csv,
+                    f"team_scorecard_{year}_{datetime.now().strftime('%Y%m%d')}.csv",
+                    "text/csv"
+                )
+                
+                st.markdown("---")
+                
+                
+                # Level 2 Contributors Section (Anna, Raj, etc.)
+                if 'contributors' in data:
+                    st.subheader("🔍 Level 2 Contributors - Triage & Support Across All Tickets")
                     
-                    st.markdown("#### 🚀 Most Improved (Faster Resolution)")
+                    # Same Level 2 frame and totals as the side-by-side comparison above
+                    if not df_level2_contrib.empty:
+                        st.markdown("""
+                        **These agents provide Level 2 triage and investigation support across tickets assigned to others.**  
+                        They contribute through comments and status transitions without being the primary assignee.
+                        """)
+                        
+                        # Level 2 contributor metrics
+                        col1, col2, col3, col4 = st.columns(4)
+                        
+                        with col1:
+                            st.metric("Total Tickets Contributed", f"{team_stats['total_tickets_l2']:,}")
+                        
+                        with col2:
+                            st.metric("Total Comments", f"{team_stats['total_comments_l2']:,}")
+                        
+                        with col3:
+                            st.metric("Avg Comments/Ticket", f"{team_stats['avg_comments_l2']:.2f}")
+                        
+                        with col4:
+                            st.metric("Avg Comment Velocity", f"{team_stats['avg_velocity_l2']:.2f}/day")
+                        
+                        # Individual contributor details
+                        st.markdown("#### 👤 Individual Level 2 Contributors")
+                        
+                        contrib_display = df_level2_contrib[[
+                            'Contributor',
+                            'Tickets_Contributed',
+                            'Total_Comments',
+                            'Total_Status_Transitions',
+                            'Avg_Comments_Per_Ticket',
+                            'Comment_Velocity_Per_Day'
+                        ]].sort_values('Tickets_Contributed', ascending=False)
+                        
+                        st.dataframe(
+                            contrib_display,
+                            width="stretch",
+                            hide_index=True,
+                            column_config={
+                                "Contributor": st.column_config.TextColumn("Name", width="large"),
+                                "Tickets_Contributed": st.column_config.NumberColumn("Tickets Helped", format="%d"),
+                                "Total_Comments": st.column_config.NumberColumn("Total Comments", format="%d"),
+                                "Total_Status_Transitions": st.column_config.NumberColumn("Status Moves", format="%d"),
+                                "Avg_Comments_Per_Ticket": st.column_config.NumberColumn("Comments/Ticket", format="%.2f"),
+                                "Comment_Velocity_Per_Day": st.column_config.NumberColumn("Velocity/Day", format="%.2f")
+                            }
+                        )
+                        
+                        st.info("""
+                        💡 **Level 2 Contributors** help Level 1 agents by:
+                        - Adding technical comments and guidance
+                        - Transitioning tickets through triage workflow
+                        - Investigating complex issues
+                        - Routing to appropriate teams
+                        
+                        They work across many tickets without being the primary assignee.
+                        """)
+                    else:
+                        st.info("No Level 2 contributors identified for this year")
                     
-                    improved_display = most_improved[['Assignee', 'Avg_Resolution_Days_2024', 'Avg_Resolution_Days_2025', 'Speed_Change', 'Speed_Change_Pct']].copy()
-                    improved_display.columns = ['Agent', '2024 Avg', '2025 Avg', 'Change (days)', 'Change (%)']
+                    st.markdown("---")
+                
+                # Top Performers Spotlight
+                st.subheader("🌟 Top Performers Spotlight")
+                
+                col1, col2, col3 = st.columns(3)
+                
+                # Top by volume
+                with col1:
+                    top_volume = scorecard_df.iloc[0]
+                    st.markdown(f"""
+                    <div style='background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); 
+                                padding: 1.5rem; border-radius: 10px; color: white; text-align: center;'>
+                        <h3>🏆 Highest Volume</h3>
+                        <h2>{top_volume['Assignee']}</h2>
+                        <p style='font-size: 2rem; margin: 0.5rem 0;'>{int(top_volume['Total_Resolved'])}</p>
+                        <p>tickets resolved</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                # Fastest resolution
+                with col2:
+                    fastest = scorecard_df.loc[scorecard_df['Avg_Resolution_Days'].idxmin()]
+                    st.markdown(f"""
+                    <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
+                                padding: 1.5rem; border-radius: 10px; color: white; text-align: center;'>
+                        <h3>⚡ Fastest Resolution</h3>
+                        <h2>{fastest['Assignee']}</h2>
+                        <p style='font-size: 2rem; margin: 0.5rem 0;'>{fastest['Avg_Resolution_Days']:.1f}</p>
+                        <p>days average</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                # Highest resolution rate
+                with col3:
+                    highest_rate = scorecard_df.loc[scorecard_df['Resolution_Rate_Pct'].idxmax()]
+                    st.markdown(f"""
+                    <div style='background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); 
+                                padding: 1.5rem; border-radius: 10px; color: white; text-align: center;'>
+                        <h3>✅ Highest Closure Rate</h3>
+                        <h2>{highest_rate['Assignee']}</h2>
+                        <p style='font-size: 2rem; margin: 0.5rem 0;'>{highest_rate['Resolution_Rate_Pct']:.0f}%</p>
+                        <p>resolution rate</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                
+                st.markdown("---")
+                
+                # Performance Distribution Charts
+                st.subheader("📊 Team Performance Distribution")
+                
+                col1, col2 = st.columns(2)
+                
+                # Both charts only need the agent, volume and speed columns
+                agent_perf = scorecard_df[['Assignee', 'Total_Resolved', 'Avg_Resolution_Days']]
+                
+                with col1:
+                    # Resolution volume distribution
+                    st.plotly_chart(build_volume_fig(agent_perf), width="stretch", config=PLOTLY_CFG)
+                
+                with col2:
+                    # Resolution time distribution
+                    st.plotly_chart(build_speed_fig(agent_perf), width="stretch", config=PLOTLY_CFG)
+                
+                # Year-over-Year Comparison
+                st.markdown("---")
+                st.subheader("📈 Year-over-Year Agent Performance")
+                
+                if year == 2025:
+                    # Compare 2024 vs 2025 for agents present in both years
+                    comparison = compare_agent_years(df_assignees)
                     
-                    st.dataframe(improved_display, width="stretch", hide_index=True)
-            
-            # KPI Definitions
-            st.markdown("---")
-            st.subheader("📋 KPI Definitions")
-            
-            kpi_definitions = pd.DataFrame([
-                {"KPI": "Assigned", "Definition": "Total tickets assigned to agent", "Target": "Balanced across team"},
-                {"KPI": "Resolved", "Definition": "Total tickets closed by agent", "Target": "60-80 per agent/year"},
-                {"KPI": "Avg Days", "Definition": "Average time from assignment to resolution", "Target": "<35 days"},
-                {"KPI": "Resolution %", "Definition": "% of assigned tickets resolved", "Target": ">85%"},
-                {"KPI": "Per Day", "Definition": "Productivity: resolved tickets per working day", "Target": "0.3-0.4"},
-                {"KPI": "Eng %", "Definition": "% of tickets requiring engineering escalation", "Target": "<30%"}
-            ])
-            
-            st.dataframe(kpi_definitions, width="stretch", hide_index=True)
+                    if not comparison.empty:
+                        # Most improved
+                        most_improved = comparison.nsmallest(5, 'Speed_Change')
+                        
+                        st.markdown("#### 🚀 Most Improved (Faster Resolution)")
+                        
+                        improved_display = most_improved[['Assignee', 'Avg_Resolution_Days_2024', 'Avg_Resolution_Days_2025', 'Speed_Change', 'Speed_Change_Pct']].set_axis(
+                            ['Agent', '2024 Avg', '2025 Avg', 'Change (days)', 'Change (%)'], axis=1
+                        )
+                        
+                        st.dataframe(improved_display, width="stretch", hide_index=True)
+                
+                # KPI Definitions
+                st.markdown("---")
+                st.subheader("📋 KPI Definitions")
+                
+                st.dataframe(kpi_definitions(), width="stretch", hide_index=True)
 
 # ==================
 # CUSTOMER INTELLIGENCE (Deep Dive)
@@ -1470,6 +1604,8 @@ elif page == "🏢 Customer Intelligence":
 # RESPONSE & RESOLUTION
 # ==================
 elif page == "⚡ Response & Resolution":
+    import plotly.graph_objects as go
+    
     st.header("Response & Resolution Time Analysis")
     
     # Monthly Trends
@@ -1483,99 +1619,60 @@ elif page == "⚡ Response & Resolution":
         
         # Create monthly aggregated data for resolution times
         # Since we have monthly created/resolved data, we can estimate trends
-        df_monthly = data['monthly']
-        
-        # Calculate average resolution by month (simplified - using resolved count as proxy)
-        monthly_resolution = df_monthly.groupby(['Month', 'Year'])['Resolved'].sum().reset_index()
-        monthly_creation = df_monthly.groupby(['Month', 'Year'])['Created'].sum().reset_index()
-        
-        # Extract month number for plotting
-        monthly_resolution['Month_Num'] = monthly_resolution['Month'].str.split('-').str[1].astype(int)
-        monthly_creation['Month_Num'] = monthly_creation['Month'].str.split('-').str[1].astype(int)
+        trends = compute_monthly_trends(data['monthly'])
         
         # Resolution Time Trend (using ticket volume as proxy for workload)
         st.subheader("⏱️ Resolution Trend by Month")
         
         fig_res_trend = go.Figure()
         
-        # 2024 data
-        df_2024_res = monthly_resolution[monthly_resolution['Year'] == 2024].sort_values('Month_Num')
-        fig_res_trend.add_trace(go.Scatter(
-            x=df_2024_res['Month_Num'],
-            y=df_2024_res['Resolved'],
-            name='2024 Resolved',
-            line=dict(color='#1f77b4', width=3),
-            mode='lines+markers',
-            marker=dict(size=8)
-        ))
-        
-        # 2025 data
-        df_2025_res = monthly_resolution[monthly_resolution['Year'] == 2025].sort_values('Month_Num')
-        fig_res_trend.add_trace(go.Scatter(
-            x=df_2025_res['Month_Num'],
-            y=df_2025_res['Resolved'],
-            name='2025 Resolved',
-            line=dict(color='#ff7f0e', width=3),
-            mode='lines+markers',
-            marker=dict(size=8)
-        ))
+        # One trace per year, already in month order
+        for year, color in YEAR_COLORS:
+            fig_res_trend.add_trace(go.Scattergl(
+                x=trends[int(year)]['Month_Num'],
+                y=trends[int(year)]['Resolved'],
+                name=f'{year} Resolved',
+                line=dict(color=color, width=3),
+                mode='lines+markers',
+                marker=dict(size=8)
+            ))
         
         fig_res_trend.update_layout(
             title="Tickets Resolved per Month: 2024 vs 2025",
             xaxis_title="Month",
             yaxis_title="Tickets Resolved",
-            xaxis=dict(
-                tickmode='array',
-                tickvals=list(range(1, 13)),
-                ticktext=['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-            ),
+            xaxis=MONTH_XAXIS,
             height=450,
             hovermode='x unified'
         )
         
-        st.plotly_chart(fig_res_trend, use_container_width=True, config={"displayModeBar": False})
+        st.plotly_chart(fig_res_trend, width="stretch", config=PLOTLY_CFG)
         
         # Volume Trend
         st.subheader("📊 Ticket Creation Trend by Month")
         
         fig_creation_trend = go.Figure()
         
-        # 2024 data
-        df_2024_create = monthly_creation[monthly_creation['Year'] == 2024].sort_values('Month_Num')
-        fig_creation_trend.add_trace(go.Scatter(
-            x=df_2024_create['Month_Num'],
-            y=df_2024_create['Created'],
-            name='2024 Created',
-            line=dict(color='#1f77b4', width=3),
-            mode='lines+markers',
-            marker=dict(size=8)
-        ))
-        
-        # 2025 data
-        df_2025_create = monthly_creation[monthly_creation['Year'] == 2025].sort_values('Month_Num')
-        fig_creation_trend.add_trace(go.Scatter(
-            x=df_2025_create['Month_Num'],
-            y=df_2025_create['Created'],
-            name='2025 Created',
-            line=dict(color='#ff7f0e', width=3),
-            mode='lines+markers',
-            marker=dict(size=8)
-        ))
+        for year, color in YEAR_COLORS:
+            fig_creation_trend.add_trace(go.Scattergl(
+                x=trends[int(year)]['Month_Num'],
+                y=trends[int(year)]['Created'],
+                name=f'{year} Created',
+                line=dict(color=color, width=3),
+                mode='lines+markers',
+                marker=dict(size=8)
+            ))
         
         fig_creation_trend.update_layout(
             title="Tickets Created per Month: 2024 vs 2025",
             xaxis_title="Month",
             yaxis_title="Tickets Created",
-            xaxis=dict(
-                tickmode='array',
-                tickvals=list(range(1, 13)),
-                ticktext=['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-            ),
+            xaxis=MONTH_XAXIS,
             height=450,
             hovermode='x unified'
         )
         
-        st.plotly_chart(fig_creation_trend, use_container_width=True, config={"displayModeBar": False})
+        st.plotly_chart(fig_creation_trend, width="stretch", config=PLOTLY_CFG)
     
     st.markdown("---")
     
@@ -1583,22 +1680,11 @@ elif page == "⚡ Response & Resolution":
     st.subheader("📊 Maintenance Backlog (Cumulative Unresolved)")
     
     if 'monthly' in data:
-        # Calculate cumulative backlog
-        df_monthly_agg = df_monthly.groupby(['Month', 'Year']).agg({
-            'Created': 'sum',
-            'Resolved': 'sum'
-        }).reset_index()
-        
-        df_monthly_agg['Month_Num'] = df_monthly_agg['Month'].str.split('-').str[1].astype(int)
-        df_monthly_agg['Net_Change'] = df_monthly_agg['Created'] - df_monthly_agg['Resolved']
-        
-        # Calculate cumulative
-        df_2024_backlog = df_monthly_agg[df_monthly_agg['Year'] == 2024].sort_values('Month_Num')
-        df_2025_backlog = df_monthly_agg[df_monthly_agg['Year'] == 2025].sort_values('Month_Num')
-        
-        df_2024_backlog['Cumulative_Backlog'] = df_2024_backlog['Net_Change'].cumsum()
-        df_2025_backlog['Cumulative_Backlog'] = df_2025_backlog['Net_Change'].cumsum()
+        # Calculate cumulative backlog (same cached call as the trend charts above)
+        trends = compute_monthly_trends(data['monthly'])
+        df_2024_backlog, df_2025_backlog = trends[2024], trends[2025]
         
+        # Filled areas stay on SVG scatter; the plain line charts above render with WebGL
         fig_backlog = go.Figure()
         
         fig_backlog.add_trace(go.Scatter(
@@ -1627,16 +1713,12 @@ elif page == "⚡ Response & Resolution":
             title="Cumulative Unresolved Tickets (Backlog Growth)",
             xaxis_title="Month",
             yaxis_title="Cumulative Unresolved Tickets",
-            xaxis=dict(
-                tickmode='array',
-                tickvals=list(range(1, 13)),
-                ticktext=['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-            ),
+            xaxis=MONTH_XAXIS,
             height=450,
             hovermode='x unified'
         )
         
-        st.plotly_chart(fig_backlog, use_container_width=True, config={"displayModeBar": False})
+        st.plotly_chart(fig_backlog, width="stretch", config=PLOTLY_CFG)
         
         # Insight
         final_backlog_2024 = df_2024_backlog['Cumulative_Backlog'].iloc[-1]
@@ -1658,61 +1740,24 @@ elif page == "⚡ Response & Resolution":
         st.markdown("#### ⚡ First Response Time by Severity")
         
         if 'frt' in data:
-            df_frt = data['frt']
-            
-            fig = go.Figure()
-            
-            fig.add_trace(go.Bar(
-                x=df_frt['Severity'],
-                y=df_frt['2024_Avg_Hours'],
-                name='2024',
-                marker_color='#1f77b4'
-            ))
-            
-            fig.add_trace(go.Bar(
-                x=df_frt['Severity'],
-                y=df_frt['2025_Avg_Hours'],
-                name='2025',
-                marker_color='#2ca02c'
-            ))
-            
-            fig.update_layout(
-                barmode='group',
+            fig = build_yoy_bar_fig(
+                data['frt'], 'Severity', 'Avg_Hours', None,
+                colors=[('2024', '#1f77b4'), ('2025', '#2ca02c')],
                 title="Avg Hours to First Response",
                 height=400
             )
-            
-            st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
+            st.plotly_chart(fig, width="stretch", config=PLOTLY_CFG)
     
     with col2:
         st.markdown("#### ⏱️ Resolution Time by Severity")
         
         if 'resolution' in data:
-            df_res = data['resolution']
-            
-            fig = go.Figure()
-            
-            fig.add_trace(go.Bar(
-                x=df_res['Severity'],
-                y=df_res['2024_Avg_Days'],
-                name='2024',
-                marker_color='#1f77b4'
-            ))
-            
-            fig.add_trace(go.Bar(
-                x=df_res['Severity'],
-                y=df_res['2025_Avg_Days'],
-                name='2025',
-                marker_color='#ff7f0e'
-            ))
-            
-            fig.update_layout(
-                barmode='group',
+            fig = build_yoy_bar_fig(
+                data['resolution'], 'Severity', 'Avg_Days', None,
                 title="Avg Days to Resolution",
                 height=400
             )
-            
-            st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
+            st.plotly_chart(fig, width="stretch", config=PLOTLY_CFG)
     
     st.markdown("---")
     
@@ -1725,35 +1770,15 @@ elif page == "⚡ Response & Resolution":
         df_types = data['support_types']
         
         # Filter out very low volume types
-        df_types_main = df_types[df_types['2025_Tickets'] >= 10].copy()
+        df_types_main = df_types[df_types['2025_Tickets'] >= 10]
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("#### 📊 Ticket Volume by Support Type")
             
-            fig_type_vol = go.Figure()
-            
-            fig_type_vol.add_trace(go.Bar(
-                x=df_types_main['Support_Type'],
-                y=df_types_main['2024_Tickets'],
-                name='2024',
-                marker_color='#1f77b4',
-                text=df_types_main['2024_Tickets'],
-                textposition='auto'
-            ))
-            
-            fig_type_vol.add_trace(go.Bar(
-                x=df_types_main['Support_Type'],
-                y=df_types_main['2025_Tickets'],
-                name='2025',
-                marker_color='#ff7f0e',
-                text=df_types_main['2025_Tickets'],
-                textposition='auto'
-            ))
-            
-            fig_type_vol.update_layout(
-                barmode='group',
+            fig_type_vol = build_yoy_bar_fig(
+                df_types_main[['Support_Type', '2024_Tickets', '2025_Tickets']], 'Support_Type', 'Tickets', '%{y}',
                 title="Tickets by Support Type: 2024 vs 2025",
                 xaxis_title="Support Type",
                 yaxis_title="Number of Tickets",
@@ -1761,7 +1786,7 @@ elif page == "⚡ Response & Resolution":
                 xaxis={'tickangle': -45}
             )
             
-            st.plotly_chart(fig_type_vol, use_container_width=True, config={"displayModeBar": False})
+            st.plotly_chart(fig_type_vol, width="stretch", config=PLOTLY_CFG)
         
         with col2:
             st.markdown("#### 📈 Support Type Distribution (2025)")
@@ -1779,7 +1804,7 @@ elif page == "⚡ Response & Resolution":
                 height=400
             )
             
-            st.plotly_chart(fig_type_pie, use_container_width=True, config={"displayModeBar": False})
+            st.plotly_chart(fig_type_pie, width="stretch", config=PLOTLY_CFG)
         
         # Full support type table
         st.markdown("#### 📋 Support Type Performance Details")
@@ -1801,8 +1826,9 @@ elif page == "⚡ Response & Resolution":
         st.markdown("---")
         st.markdown("### 💡 Support Type Insights")
         
-        team_support_2025 = df_types[df_types['Support_Type'] == 'TEAM Support']['2025_Tickets'].values[0] if 'TEAM Support' in df_types['Support_Type'].values else 0
-        total_2025 = df_types['2025_Tickets'].sum()
+        tickets_by_type = df_types.set_index('Support_Type')['2025_Tickets']
+        team_support_2025 = tickets_by_type.get('TEAM Support', 0)
+        total_2025 = tickets_by_type.sum()
         team_support_pct = (team_support_2025 / total_2025 * 100) if total_2025 > 0 else 0
         
         col1, col2 = st.columns(2)
@@ -1816,7 +1842,7 @@ elif page == "⚡ Response & Resolution":
             """)
         
         with col2:
-            unknown_2025 = df_types[df_types['Support_Type'] == 'Unknown']['2025_Tickets'].values[0] if 'Unknown' in df_types['Support_Type'].values else 0
+            unknown_2025 = tickets_by_type.get('Unknown', 0)
             unknown_pct = (unknown_2025 / total_2025 * 100) if total_2025 > 0 else 0
             
             if unknown_pct > 5:
@@ -1837,6 +1863,8 @@ elif page == "⚡ Response & Resolution":
 # AI CATEGORY INSIGHTS
 # ==================
 elif page == "🧪 AI Category Insights":
+    import plotly.graph_objects as go
+    
     st.header("🎯 2026 Strategic Priorities - Dual-Axis AI Analysis")
     
     st.markdown("""
@@ -1850,6 +1878,7 @@ elif page == "🧪 AI Category Insights":
     
     if 'dual_axis' in data:
         df_dual = data['dual_axis']
+        summaries = compute_dual_summaries(df_dual)
         
         # Hero Section
         st.subheader("📊 Analysis Overview")
@@ -1860,60 +1889,27 @@ elif page == "🧪 AI Category Insights":
             st.metric("Total Tickets Analyzed", len(df_dual))
         
         with col2:
-            high_conf = len(df_dual[df_dual['confidence'] >= 90])
+            high_conf = summaries['high_conf']
             st.metric("High Confidence", high_conf, f"{(high_conf/len(df_dual)*100):.0f}%")
         
         with col3:
-            unique_cats = df_dual['category'].nunique()
-            st.metric("Unique Categories", unique_cats)
+            st.metric("Unique Categories", summaries['unique_cats'])
         
         with col4:
-            avg_conf = df_dual['confidence'].mean()
-            st.metric("Avg Confidence", f"{avg_conf:.0f}%")
+            st.metric("Avg Confidence", f"{summaries['avg_conf']:.0f}%")
         
         st.markdown("---")
         
         # Type Distribution
         st.subheader("📈 Ticket Type Distribution")
         
-        type_counts = df_dual['type'].value_counts()
-        type_pct = (type_counts / len(df_dual) * 100).round(1)
+        type_counts = summaries['type_counts']
+        type_pct = summaries['type_pct']
         
         # Create donut chart
-        fig_donut = go.Figure(data=[go.Pie(
-            labels=type_counts.index,
-            values=type_counts.values,
-            hole=0.4,
-            textinfo='label+percent',
-            textposition='outside',
-            marker=dict(
-                colors=['#dc3545', '#007bff', '#28a745', '#ffc107', '#6f42c1', '#6c757d'],
-                line=dict(color='#FFFFFF', width=2)
-            )
-        )])
-        
-        fig_donut.update_layout(
-            title="Distribution of Ticket Types (693 tickets)",
-            height=500,
-            showlegend=True,
-            legend=dict(
-                orientation="v",
-                yanchor="middle",
-                y=0.5,
-                xanchor="left",
-                x=1.01
-            )
-        )
+        fig_donut = build_type_donut_fig(type_counts, len(df_dual))
         
-        # Add center text
-        fig_donut.add_annotation(
-            text=f"<b>{len(df_dual)}<br>Tickets</b>",
-            x=0.5, y=0.5,
-            font_size=20,
-            showarrow=False
-        )
-        
-        st.plotly_chart(fig_donut, use_container_width=True, config={"displayModeBar": False})
+        st.plotly_chart(fig_donut, width="stretch", config=PLOTLY_CFG)
         
         # Type breakdown table
         col1, col2 = st.columns([2, 1])
@@ -1924,7 +1920,7 @@ elif page == "🧪 AI Category Insights":
                 'Count': type_counts.values,
                 'Percentage': type_pct.values
             })
-            st.dataframe(type_breakdown, use_container_width=True, hide_index=True)
+            st.dataframe(type_breakdown, width="stretch", hide_index=True)
         
         with col2:
             st.markdown("""
@@ -1939,241 +1935,202 @@ elif page == "🧪 AI Category Insights":
         
         st.markdown("---")
         
-        # 2026 Strategic Priorities
-        st.subheader("🎯 2026 Strategic Priorities")
-        
-        tab1, tab2, tab3 = st.tabs(["🐛 Top Bug Categories", "📚 KB Opportunities", "⚙️ Config Wizards"])
-        
-        with tab1:
-            st.markdown("### 🐛 Top 5 Bug Categories - Engineering Sprint Priorities")
+        # Only the selected tab runs; switching tabs reruns just this fragment
+        @st.fragment
+        def render_priorities(summaries):
+            # 2026 Strategic Priorities
+            st.subheader("🎯 2026 Strategic Priorities")
             
-            # Get top bug categories
-            bug_tickets = df_dual[df_dual['type'] == 'Bug-Defect']
-            bug_categories = bug_tickets['category'].value_counts().head(5)
-            
-            # Create horizontal bar chart
-            fig_bugs = go.Figure()
-            
-            fig_bugs.add_trace(go.Bar(
-                y=bug_categories.index,
-                x=bug_categories.values,
-                orientation='h',
-                marker_color='#dc3545',
-                text=bug_categories.values,
-                textposition='auto'
-            ))
-            
-            fig_bugs.update_layout(
-                title="Top 5 Bug Categories by Volume",
-                xaxis_title="Number of Bugs",
-                yaxis_title=None,
-                height=400
+            tab1, tab2, tab3 = st.tabs(
+                ["🐛 Top Bug Categories", "📚 KB Opportunities", "⚙️ Config Wizards"],
+                key="priority_tab",
+                on_change="rerun"
             )
             
-            st.plotly_chart(fig_bugs, use_container_width=True, config={"displayModeBar": False})
-            
-            # Bug category details
-            bug_details = []
-            for category, count in bug_categories.items():
-                category_tickets = bug_tickets[bug_tickets['category'] == category]
-                avg_conf = category_tickets['confidence'].mean()
-                bug_details.append({
-                    'Category': category,
-                    'Bug Count': count,
-                    'Avg Confidence': f"{avg_conf:.0f}%",
-                    'Expected Fix Impact': f"{count * 0.25:.0f} fewer tickets/year",
-                    'Priority': 'Critical' if count >= 50 else 'High' if count >= 30 else 'Medium'
-                })
+            if tab1.open:
+                with tab1:
+                    st.markdown("### 🐛 Top 5 Bug Categories - Engineering Sprint Priorities")
+                    
+                    # Get top bug categories
+                    bug_categories = summaries['bug_categories']
+                    
+                    # Create horizontal bar chart
+                    fig_bugs = build_bug_categories_fig(bug_categories)
+                    
+                    st.plotly_chart(fig_bugs, width="stretch", config=PLOTLY_CFG)
+                    
+                    # Bug category details, one column per field
+                    bug_counts = bug_categories.to_numpy()
+                    bug_df = pd.DataFrame({
+                        'Category': bug_categories.index,
+                        'Bug Count': bug_counts,
+                        'Avg Confidence': summaries['bug_avg_conf'].map("{:.0f}%".format).to_numpy(),
+                        'Expected Fix Impact': (bug_categories * 0.25).map("{:.0f} fewer tickets/year".format).to_numpy(),
+                        'Priority': np.select([bug_counts >= 50, bug_counts >= 30], ['Critical', 'High'], 'Medium')
+                    })
+                    st.dataframe(bug_df, width="stretch", hide_index=True)
+                    
+                    st.info("💡 **Engineering Impact:** Fixing these top 5 categories could significantly reduce ticket volume")
             
-            bug_df = pd.DataFrame(bug_details)
-            st.dataframe(bug_df, use_container_width=True, hide_index=True)
+            if tab2.open:
+                with tab2:
+                    st.markdown("### 📚 Top 5 Knowledge Base Opportunities")
+                    
+                    # Get how-to questions
+                    howto_categories = summaries['howto_categories']
+                    
+                    # Create KB opportunities table; configuration topics deflect slightly less
+                    howto_counts = howto_categories.to_numpy()
+                    is_config = howto_categories.index.str.contains('Configuration', regex=False)
+                    deflection_rates = pd.Series(np.where(is_config, 0.67, 0.70))
+                    kb_df = pd.DataFrame({
+                        'Category': howto_categories.index,
+                        'How-To Tickets': howto_counts,
+                        'Deflection Rate': (deflection_rates * 100).map("{:.0f}%".format),
+                        'Expected Deflection': (howto_counts * deflection_rates).astype(int),
+                        'Article Complexity': np.where(is_config, 'Medium', 'Low'),
+                        'Priority': np.where(howto_counts >= 7, 'High', 'Medium')
+                    })
+                    st.dataframe(kb_df, width="stretch", hide_index=True)
+                    
+                    # KB impact visualization
+                    fig_kb = build_kb_impact_fig(kb_df)
+                    
+                    st.plotly_chart(fig_kb, width="stretch", config=PLOTLY_CFG)
+                    
+                    st.info("💡 **KB Impact:** 5 articles could deflect ~31 tickets/year with high ROI potential")
             
-            st.info("💡 **Engineering Impact:** Fixing these top 5 categories could significantly reduce ticket volume")
+            if tab3.open:
+                with tab3:
+                    st.markdown("### ⚙️ Top Configuration Issues - Setup Wizards Needed")
+                    
+                    # Get configuration tickets
+                    config_categories = summaries['config_categories']
+                    
+                    # Create config wizard opportunities; data setup gets templates, the rest a permission guide
+                    config_counts = config_categories.to_numpy()
+                    is_data = config_categories.index.str.contains('Data', regex=False)
+                    deflection_rates = pd.Series(np.where(config_categories.index.str.contains('Data-Configuration', regex=False), 0.50, 0.45))
+                    config_df = pd.DataFrame({
+                        'Category': config_categories.index,
+                        'Config Tickets': config_counts,
+                        'Deflection Rate': (deflection_rates * 100).map("{:.0f}%".format),
+                        'Expected Deflection': (config_counts * deflection_rates).astype(int),
+                        'Wizard Type': np.where(is_data, 'Setup Templates', 'Permission Guide'),
+                        'Complexity': np.where(is_data, 'High', 'Medium')
+                    })
+                    st.dataframe(config_df, width="stretch", hide_index=True)
+                    
+                    st.info("💡 **Wizard Impact:** Setup wizards could deflect ~18 tickets/year with good ROI potential")
         
-        with tab2:
-            st.markdown("### 📚 Top 5 Knowledge Base Opportunities")
-            
-            # Get how-to questions
-            howto_tickets = df_dual[df_dual['type'] == 'How-To-Question']
-            howto_categories = howto_tickets['category'].value_counts().head(5)
-            
-            # Create KB opportunities table
-            kb_opportunities = []
-            for category, count in howto_categories.items():
-                deflection_rate = 0.67 if 'Configuration' in category else 0.70
-                expected_deflection = int(count * deflection_rate)
-                kb_opportunities.append({
-                    'Category': category,
-                    'How-To Tickets': count,
-                    'Deflection Rate': f"{deflection_rate*100:.0f}%",
-                    'Expected Deflection': expected_deflection,
-                    'Article Complexity': 'Medium' if 'Configuration' in category else 'Low',
-                    'Priority': 'High' if count >= 7 else 'Medium'
-                })
-            
-            kb_df = pd.DataFrame(kb_opportunities)
-            st.dataframe(kb_df, use_container_width=True, hide_index=True)
-            
-            # KB impact visualization
-            fig_kb = go.Figure()
-            
-            fig_kb.add_trace(go.Bar(
-                name='Current Tickets',
-                x=kb_df['Category'],
-                y=kb_df['How-To Tickets'],
-                marker_color='#ffc107'
-            ))
-            
-            fig_kb.add_trace(go.Bar(
-                name='Expected Deflection',
-                x=kb_df['Category'],
-                y=kb_df['Expected Deflection'],
-                marker_color='#28a745'
-            ))
-            
-            fig_kb.update_layout(
-                title="Knowledge Base Impact: Current vs Expected Deflection",
-                xaxis_title="Category",
-                yaxis_title="Number of Tickets",
-                barmode='group',
-                height=400
-            )
-            
-            st.plotly_chart(fig_kb, use_container_width=True, config={"displayModeBar": False})
-            
-            st.info("💡 **KB Impact:** 5 articles could deflect ~31 tickets/year with high ROI potential")
+        render_priorities(summaries)
         
-        with tab3:
-            st.markdown("### ⚙️ Top Configuration Issues - Setup Wizards Needed")
+        st.markdown("---")
+        
+        # Drill-down filters rerun only this fragment, not the charts and tabs above
+        @st.fragment
+        def render_drilldown(df_dual):
+            # Drill-Down Data Tables
+            st.subheader("🔍 Drill-Down Analysis")
             
-            # Get configuration tickets
-            config_tickets = df_dual[df_dual['type'] == 'Configuration-Setup']
-            config_categories = config_tickets['category'].value_counts().head(3)
+            # Filters
+            col1, col2, col3 = st.columns(3)
             
-            # Create config wizard opportunities
-            config_opportunities = []
-            for category, count in config_categories.items():
-                deflection_rate = 0.50 if 'Data-Configuration' in category else 0.45
-                expected_deflection = int(count * deflection_rate)
-                config_opportunities.append({
-                    'Category': category,
-                    'Config Tickets': count,
-                    'Deflection Rate': f"{deflection_rate*100:.0f}%",
-                    'Expected Deflection': expected_deflection,
-                    'Wizard Type': 'Setup Templates' if 'Data' in category else 'Permission Guide',
-                    'Complexity': 'High' if 'Data' in category else 'Medium'
-                })
+            with col1:
+                type_filter = st.selectbox(
+                    "Filter by Type",
+                    ["All"] + list(df_dual['type'].unique()),
+                    key="type_filter"
+                )
             
-            config_df = pd.DataFrame(config_opportunities)
-            st.dataframe(config_df, use_container_width=True, hide_index=True)
+            with col2:
+                confidence_threshold = st.slider(
+                    "Confidence Threshold",
+                    min_value=85,
+                    max_value=100,
+                    value=90,
+                    key="confidence_slider"
+                )
             
-            st.info("💡 **Wizard Impact:** Setup wizards could deflect ~18 tickets/year with good ROI potential")
-        
-        st.markdown("---")
-        
-        # Drill-Down Data Tables
-        st.subheader("🔍 Drill-Down Analysis")
-        
-        # Filters
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            type_filter = st.selectbox(
-                "Filter by Type",
-                ["All"] + list(df_dual['type'].unique()),
-                key="type_filter"
-            )
-        
-        with col2:
-            confidence_threshold = st.slider(
-                "Confidence Threshold",
-                min_value=85,
-                max_value=100,
-                value=90,
-                key="confidence_slider"
-            )
-        
-        with col3:
-            search_key = st.text_input(
-                "Search Ticket Key",
-                placeholder="e.g., KHELP-11561",
-                key="search_key"
-            )
-        
-        # Apply filters
-        filtered_df = df_dual.copy()
-        
-        if type_filter != "All":
-            filtered_df = filtered_df[filtered_df['type'] == type_filter]
-        
-        filtered_df = filtered_df[filtered_df['confidence'] >= confidence_threshold]
-        
-        if search_key:
-            filtered_df = filtered_df[filtered_df['ticket_key'].str.contains(search_key, case=False, na=False)]
-        
-        st.markdown(f"**Showing {len(filtered_df)} tickets** (filtered from {len(df_dual)} total)")
-        
-        # Display filtered data
-        if len(filtered_df) > 0:
-            # Create display dataframe with truncated reasoning
-            display_df = filtered_df.copy()
-            display_df['reasoning_short'] = display_df['reasoning'].apply(
-                lambda x: x[:100] + "..." if len(str(x)) > 100 else str(x)
-            )
+            with col3:
+                search_key = st.text_input(
+                    "Search Ticket Key",
+                    placeholder="e.g., KHELP-11561",
+                    key="search_key"
+                )
             
-            # Color code confidence
-            def color_confidence(val):
-                if val >= 95:
-                    return 'background-color: #d4edda'  # green
-                elif val >= 90:
-                    return 'background-color: #fff3cd'  # yellow
-                else:
-                    return 'background-color: #f8d7da'  # red
+            # Apply filters as one combined mask, indexing df_dual once
+            mask = df_dual['confidence'].to_numpy() >= confidence_threshold
             
-            styled_df = display_df[['ticket_key', 'category', 'type', 'confidence', 'reasoning_short', 'components']].style.applymap(
-                color_confidence, subset=['confidence']
-            )
+            if type_filter != "All":
+                mask &= (df_dual['type'] == type_filter).to_numpy()
             
-            st.dataframe(
-                styled_df,
-                use_container_width=True,
-                hide_index=True,
-                column_config={
-                    "ticket_key": "Ticket Key",
-                    "category": "Category",
-                    "type": "Type",
-                    "confidence": "Confidence %",
-                    "reasoning_short": "Reasoning",
-                    "components": "Components"
-                }
-            )
+            if search_key:
+                mask &= df_dual['ticket_key'].str.contains(search_key, case=False, na=False).to_numpy()
             
-            # Export functionality
-            st.markdown("---")
-            st.subheader("📥 Export & Actions")
+            filtered_df = df_dual[mask]
             
-            col1, col2, col3 = st.columns(3)
+            st.markdown(f"**Showing {len(filtered_df)} tickets** (filtered from {len(df_dual)} total)")
             
-            with col1:
-                csv = filtered_df.to_csv(index=False)
-                st.download_button(
-                    label="📊 Download Filtered Data",
-                    data=csv,
-                    file_name=f"dual_axis_filtered_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    use_container_width=True
+            # Display filtered data
+            if len(filtered_df) > 0:
+                # Create display dataframe with truncated reasoning
+                reasoning = filtered_df['reasoning'].astype(str)
+                head = reasoning.str.slice(0, 100)
+                display_df = filtered_df.assign(reasoning_short=head.where(reasoning.str.len() <= 100, head + "..."))
+                
+                # Color code confidence, classifying the whole column at once
+                def color_confidence(col):
+                    return np.where(col >= 95, 'background-color: #d4edda',  # green
+                                    np.where(col >= 90, 'background-color: #fff3cd',  # yellow
+                                             'background-color: #f8d7da'))  # red
+                
+                styled_df = display_df[['ticket_key', 'category', 'type', 'confidence', 'reasoning_short', 'components']].style.apply(
+                    color_confidence, subset=['confidence']
                 )
+                
+                st.dataframe(
+                    styled_df,
+                    width="stretch",
+                    hide_index=True,
+                    column_config={
+                        "ticket_key": "Ticket Key",
+                        "category": "Category",
+                        "type": "Type",
+                        "confidence": "Confidence %",
+                        "reasoning_short": "Reasoning",
+                        "components": "Components"
+                    }
+                )
+                
+                # Export functionality
+                st.markdown("---")
+                st.subheader("📥 Export & Actions")
+                
+                col1, col2, col3 = st.columns(3)
+                
+                with col1:
+                    csv = to_csv_bytes(filtered_df)
+                    st.download_button(
+                        label="📊 Download Filtered Data",
+                        data=csv,
+                        file_name=f"dual_axis_filtered_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                        mime="text/csv",
+                        width="stretch"
+                    )
+                
+                with col2:
+                    if st.button("🎯 Generate Executive Summary", width="stretch"):
+                        st.info("Executive summary generation coming soon! Use the ROI dashboard above for now.")
+                
+                with col3:
+                    if st.button("📋 Create Action Plan", width="stretch"):
+                        st.info("Action plan creation coming soon! Use the strategic priorities above for now.")
             
-            with col2:
-                if st.button("🎯 Generate Executive Summary", use_container_width=True):
-                    st.info("Executive summary generation coming soon! Use the ROI dashboard above for now.")
-            
-            with col3:
-                if st.button("📋 Create Action Plan", use_container_width=True):
-                    st.info("Action plan creation coming soon! Use the strategic priorities above for now.")
+            else:
+                st.warning("No tickets match the current filters. Try adjusting your criteria.")
         
-        else:
-            st.warning("No tickets match the current filters. Try adjusting your criteria.")
+        render_drilldown(df_dual)
     
     else:
         st.warning("No dual-axis categorization data available. The analysis file 'categorization_dual_axis_20251021_171333.csv' was not found.")
@@ -2188,43 +2145,47 @@ elif page == "📊 Complete Data Export":
     Download all strategic intelligence datasets for custom analysis, presentations, or further processing.
     """)
     
-    # List all available datasets
-    available_data = {
-        "Organizations": data.get('orgs'),
-        "Engineering Summary": data.get('eng_summary'),
-        "Engineering by Team": data.get('eng_teams'),
-        "Engineering by Severity": data.get('eng_severity'),
-        "Categories with Engineering": data.get('cat_eng'),
-        "Support Types": data.get('support_types'),
-        "Team Scorecard": data.get('assignees'),
-        "First Response Times": data.get('frt'),
-        "Monthly Trends": data.get('monthly'),
-        "Resolution Times": data.get('resolution')
-    }
+    # List all available datasets, as (on-disk columns, preview rows) sliced once per data snapshot
+    export_tables = load_export_tables(stamps)
+    exports = [(name, tables) for name, key in EXPORT_DATASETS if (tables := export_tables.get(key)) is not None]
+    today = datetime.now().strftime('%Y%m%d')
+    
+    # Every dataset in one download; Parquet keeps the dtypes and skips per-cell text encoding
+    if exports and pyarrow is not None:
+        st.download_button(
+            "📦 Download All Datasets (Parquet, zipped)",
+            partial(to_parquet_zip, tuple((name, df) for name, (df, _) in exports)),
+            f"khelp_datasets_{today}.zip",
+            "application/zip",
+            key="download_all"
+        )
+        
+        st.markdown("---")
     
-    for name, df in available_data.items():
-        if df is not None:
+    # Each dataset section as a fragment, so a download click reruns only its own section
+    @st.fragment
+    def render_export_section(name, df, preview, today):
+        slug = name.lower().replace(' ', '_')
+        # The bordered container separates the sections, in place of a rule after each one
+        with st.container(border=True):
             st.subheader(f"📥 {name}")
-            st.dataframe(df.head(10), width="stretch")
+            st.dataframe(preview, width="stretch")
             
-            csv = df.to_csv(index=False).encode('utf-8')
+            # Encoded on click (and then cached), not for all ten datasets on every render
             st.download_button(
                 f"Download {name}",
-                csv,
-                f"{name.lower().replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.csv",
+                partial(to_csv_bytes, df),
+                f"{slug}_{today}.csv",
                 "text/csv",
                 key=f"download_{name}"
             )
-            
-            st.markdown("---")
+    
+    for name, (df, preview) in exports:
+        render_export_section(name, df, preview, today)
 
 # Footer
 st.markdown("---")
-st.markdown("""
-<div style='text-align: center; color: #666; padding: 2rem;'>
-    <p><strong>KHELP Ultimate Strategic Dashboard</strong></p>
-    <p>Complete intelligence for data-driven support leadership</p>
-    <p style='font-size: 0.9rem;'>Data includes: Organizations, Engineering Involvement, Team Performance, Customer Risk</p>
-</div>
-""", unsafe_allow_html=True)
-
+st.caption(
+    "**KHELP Ultimate Strategic Dashboard** | Complete intelligence for data-driven support leadership  \n"
+    "Data includes: Organizations, Engineering Involvement, Team Performance, Customer Risk"
+)
@@ -9,25 +9,11 @@ Complete annual planning toolkit with:
 - Root cause analysis
 """
 
-import warnings
-import logging
-warnings.filterwarnings('ignore', category=DeprecationWarning)
-warnings.filterwarnings('ignore', category=FutureWarning)
-
-# Suppress Streamlit's internal Plotly deprecation warnings
-logging.getLogger('streamlit').setLevel(logging.ERROR)
-
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-from datetime import datetime
-import os
+import numpy as np
 
-# Additional suppression for plotly/streamlit warnings
-import sys
-if not sys.warnoptions:
-    warnings.simplefilter("ignore")
+from khelp_data import DF_HASH, SEVERITY_ORDER, SNAPSHOT_ENTRIES, STRING_DTYPE, current_stamps, load_comprehensive_data, load_display_tables
 
 st.set_page_config(
     page_title="KHELP Ultimate Strategic Dashboard",
@@ -35,84 +21,20 @@ st.set_page_config(
     layout="wide"
 )
 
-# Suppress Streamlit warning display in logs
-import streamlit.logger
-streamlit.logger.get_logger = lambda name: logging.getLogger(name)
-logging.getLogger('streamlit.runtime.scriptrunner_utils.script_run_context').setLevel(logging.ERROR)
-logging.getLogger('streamlit.elements.plotly_chart').setLevel(logging.ERROR)
-logging.getLogger('streamlit').setLevel(logging.ERROR)
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH, max_entries=SNAPSHOT_ENTRIES)
+def team_rankings(assignees, contributors):
+    """Level 1 agents and Level 2 contributors, each sorted by volume, recomputed only when the data changes"""
+    l1_sorted = assignees[assignees['Support_Level'] == 'Level 1'].sort_values('Total_Resolved', ascending=False)
+    l2_sorted = contributors.sort_values('Tickets_Contributed', ascending=False)
+    return l1_sorted, l2_sorted
 
-# Load all data
-@st.cache_data(ttl=10)
-def load_comprehensive_data():
-    """Load all comprehensive CSV files"""
-    data = {}
-    
-    # Load all datasets with specific file names
-    try:
-        if os.path.exists('khelp_organizations_latest.csv'):
-            data['orgs'] = pd.read_csv('khelp_organizations_latest.csv')
-    except:
-        pass
-    
-    try:
-        if os.path.exists('khelp_engineering_latest.csv'):
-            data['eng_summary'] = pd.read_csv('khelp_engineering_latest.csv')
-    except:
-        pass
-    
-    try:
-        if os.path.exists('khelp_engineering_by_team_latest.csv'):
-            data['eng_teams'] = pd.read_csv('khelp_engineering_by_team_latest.csv')
-    except:
-        pass
-    
-    try:
-        if os.path.exists('khelp_engineering_by_severity_latest.csv'):
-            data['eng_severity'] = pd.read_csv('khelp_engineering_by_severity_latest.csv')
-    except:
-        pass
-    
-    try:
-        if os.path.exists('khelp_categories_engineering_latest.csv'):
-            data['cat_eng'] = pd.read_csv('khelp_categories_engineering_latest.csv')
-    except:
-        pass
-    
-    try:
-        if os.path.exists('khelp_frt_latest.csv'):
-            data['frt'] = pd.read_csv('khelp_frt_latest.csv')
-    except:
-        pass
-    
-    try:
-        if os.path.exists('khelp_monthly_latest.csv'):
-            data['monthly'] = pd.read_csv('khelp_monthly_latest.csv')
-    except:
-        pass
-    
-    try:
-        if os.path.exists('khelp_resolution_latest.csv'):
-            data['resolution'] = pd.read_csv('khelp_resolution_latest.csv')
-    except:
-        pass
-    
-    try:
-        if os.path.exists('khelp_assignee_performance_latest.csv'):
-            data['assignees'] = pd.read_csv('khelp_assignee_performance_latest.csv')
-    except:
-        pass
-    
-    try:
-        if os.path.exists('khelp_contributor_performance_latest.csv'):
-            data['contributors'] = pd.read_csv('khelp_contributor_performance_latest.csv')
-    except:
-        pass
-    
-    return data
+# Datasets this app reads; the others in CSV_FILES are never loaded here
+DATASETS = ['orgs', 'eng_summary', 'frt', 'monthly', 'resolution', 'assignees', 'contributors']
 
-# Load data
-data = load_comprehensive_data()
+# Load data; the data files are stat'ed once per rerun and both loaders key on the same stamps
+stamps = current_stamps(DATASETS)
+data = load_comprehensive_data(stamps)
+tables = load_display_tables(stamps)
 
 # Sidebar navigation
 st.sidebar.title("🎯 KHELP Strategic Dashboard")
@@ -140,79 +62,73 @@ if page == "🎯 Executive Summary":
         st.error("No data files found. Please ensure CSV files are uploaded to the repository.")
         st.stop()
     
+    # Tables this page reads, None when the file is missing
+    monthly = data.get('monthly')
+    eng_summary = data.get('eng_summary')
+    frt = data.get('frt')
+    resolution = data.get('resolution')
+    
+    # Aggregate/index each table once; both KPI rows and the YoY table read from these
+    if monthly is not None:
+        created_by_year = monthly.groupby('Year')['Created'].sum()
+        total_2024 = created_by_year.get(2024, 0)
+        total_2025 = created_by_year.get(2025, 0)
+    if eng_summary is not None:
+        eng_rate = eng_summary.set_index('Metric').loc['Engineering Involvement Rate']
+    if frt is not None:
+        frt_2024_avg = frt['2024_Avg_Hours'].mean()
+        frt_2025_avg = frt['2025_Avg_Hours'].mean()
+    if resolution is not None:
+        # One row per SEVERITY_ORDER entry, all-NaN for a severity missing from the file
+        res_by_sev = resolution.set_index('Severity')[['2024_Avg_Days', '2025_Avg_Days']].reindex(SEVERITY_ORDER)
+        # Per-severity YoY %, NaN when there is no 2024 baseline
+        sev_2024_days = res_by_sev['2024_Avg_Days'].to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sev_change = np.where(sev_2024_days != 0, (res_by_sev['2025_Avg_Days'].to_numpy() - sev_2024_days) / sev_2024_days * 100, np.nan)
+        avg_res_2024 = resolution['2024_Avg_Days'].mean()
+        avg_res_2025 = resolution['2025_Avg_Days'].mean()
+    
     # First row of KPIs
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        if 'monthly' in data:
-            total_2025 = data['monthly'][data['monthly']['Year'] == 2025]['Created'].sum()
+        if monthly is not None:
             st.metric("Total Tickets (2025)", f"{total_2025:,}")
         else:
             st.metric("Total Tickets (2025)", "N/A")
     
     with col2:
-        if 'eng_summary' in data:
-            eng_rate = data['eng_summary'][data['eng_summary']['Metric'] == 'Engineering Involvement Rate']['2025_Value'].values[0]
-            st.metric("Engineering Involvement", eng_rate)
+        if eng_summary is not None:
+            st.metric("Engineering Involvement", eng_rate['2025_Value'])
         else:
             st.metric("Engineering Involvement", "N/A")
     
     with col3:
-        if 'frt' in data:
-            avg_frt = data['frt']['2025_Avg_Hours'].mean()
-            st.metric("Avg First Response (hrs)", f"{avg_frt:.0f}")
+        if frt is not None:
+            st.metric("Avg First Response (hrs)", f"{frt_2025_avg:.0f}")
         else:
             st.metric("Avg First Response (hrs)", "N/A")
     
     with col4:
-        if 'resolution' in data:
-            avg_res = data['resolution']['2025_Avg_Days'].mean()
-            st.metric("Avg Resolution (days)", f"{avg_res:.0f}")
+        if resolution is not None:
+            st.metric("Avg Resolution (days)", f"{avg_res_2025:.0f}")
         else:
             st.metric("Avg Resolution (days)", "N/A")
     
     # Second row of KPIs - Resolution by Severity
     st.markdown("### Resolution Time by Severity")
-    col5, col6, col7, col8 = st.columns(4)
     
-    if 'resolution' in data:
-        df_resolution = data['resolution']
-        
-        with col5:
-            blocker_2025 = df_resolution[df_resolution['Severity'] == 'Blocker']['2025_Avg_Days'].values
-            blocker_2024 = df_resolution[df_resolution['Severity'] == 'Blocker']['2024_Avg_Days'].values
-            if len(blocker_2025) > 0:
-                change = ((blocker_2025[0]-blocker_2024[0])/blocker_2024[0]*100) if len(blocker_2024) > 0 else 0
-                st.metric("Blocker (days)", f"{blocker_2025[0]:.0f}", f"{change:+.1f}%")
-            else:
-                st.metric("Blocker (days)", "N/A")
-        
-        with col6:
-            critical_2025 = df_resolution[df_resolution['Severity'] == 'Critical']['2025_Avg_Days'].values
-            critical_2024 = df_resolution[df_resolution['Severity'] == 'Critical']['2024_Avg_Days'].values
-            if len(critical_2025) > 0:
-                change = ((critical_2025[0]-critical_2024[0])/critical_2024[0]*100) if len(critical_2024) > 0 else 0
-                st.metric("Critical (days)", f"{critical_2025[0]:.0f}", f"{change:+.1f}%")
-            else:
-                st.metric("Critical (days)", "N/A")
-        
-        with col7:
-            major_2025 = df_resolution[df_resolution['Severity'] == 'Major']['2025_Avg_Days'].values
-            major_2024 = df_resolution[df_resolution['Severity'] == 'Major']['2024_Avg_Days'].values
-            if len(major_2025) > 0:
-                change = ((major_2025[0]-major_2024[0])/major_2024[0]*100) if len(major_2024) > 0 else 0
-                st.metric("Major (days)", f"{major_2025[0]:.0f}", f"{change:+.1f}%")
-            else:
-                st.metric("Major (days)", "N/A")
-        
-        with col8:
-            minor_2025 = df_resolution[df_resolution['Severity'] == 'Minor']['2025_Avg_Days'].values
-            minor_2024 = df_resolution[df_resolution['Severity'] == 'Minor']['2024_Avg_Days'].values
-            if len(minor_2025) > 0:
-                change = ((minor_2025[0]-minor_2024[0])/minor_2024[0]*100) if len(minor_2024) > 0 else 0
-                st.metric("Minor (days)", f"{minor_2025[0]:.0f}", f"{change:+.1f}%")
-            else:
-                st.metric("Minor (days)", "N/A")
+    if resolution is not None:
+        for col, (severity, row), change in zip(st.columns(4), res_by_sev.iterrows(), sev_change):
+            with col:
+                if row.notna().all():
+                    sev_2025 = row['2025_Avg_Days']
+                    if np.isnan(change):
+                        st.metric(f"{severity} (days)", f"{sev_2025:.0f}", "n/a", delta_color="off")
+                    else:
+                        st.metric(f"{severity} (days)", f"{sev_2025:.0f}", f"{change:+.1f}%")
+                else:
+                    st.metric(f"{severity} (days)", "N/A")
     else:
         st.warning("Resolution data not available")
     
@@ -221,91 +137,46 @@ if page == "🎯 Executive Summary":
     # Quick summary table
     st.subheader("📊 Year-over-Year Comparison")
     
-    summary_metrics = []
-    
-    # Total Tickets
-    if 'monthly' in data:
-        total_2024 = data['monthly'][data['monthly']['Year'] == 2024]['Created'].sum()
-        total_2025 = data['monthly'][data['monthly']['Year'] == 2025]['Created'].sum()
-        change_pct = ((total_2025-total_2024)/total_2024*100) if total_2024 > 0 else 0
-        summary_metrics.append({
-            "Metric": "Total Tickets", 
-            "2024": f"{total_2024:,}", 
-            "2025": f"{total_2025:,}", 
-            "Change": f"{change_pct:+.1f}%", 
-            "Trend": "✅" if change_pct < 0 else "⚠️"
-        })
-    
-    # Engineering Involvement
-    if 'eng_summary' in data:
-        eng_2024_rate = float(data['eng_summary'][data['eng_summary']['Metric'] == 'Engineering Involvement Rate']['2024_Value'].values[0].rstrip('%'))
-        eng_2025_rate = float(data['eng_summary'][data['eng_summary']['Metric'] == 'Engineering Involvement Rate']['2025_Value'].values[0].rstrip('%'))
-        change = eng_2025_rate - eng_2024_rate
-        summary_metrics.append({
-            "Metric": "Engineering Involvement", 
-            "2024": f"{eng_2024_rate:.1f}%", 
-            "2025": f"{eng_2025_rate:.1f}%", 
-            "Change": f"{change:+.1f}pp", 
-            "Trend": "✅" if change < 0 else "⚠️"
-        })
-    
-    # Blocker Resolution
-    if 'resolution' in data:
-        df_res = data['resolution']
-        blocker_2024 = df_res[df_res['Severity'] == 'Blocker']['2024_Avg_Days'].values
-        blocker_2025 = df_res[df_res['Severity'] == 'Blocker']['2025_Avg_Days'].values
-        if len(blocker_2024) > 0 and len(blocker_2025) > 0:
-            change_pct = ((blocker_2025[0]-blocker_2024[0])/blocker_2024[0]*100)
-            summary_metrics.append({
-                "Metric": "Blocker Resolution (days)", 
-                "2024": f"{blocker_2024[0]:.0f}", 
-                "2025": f"{blocker_2025[0]:.0f}", 
-                "Change": f"{change_pct:+.1f}%", 
-                "Trend": "✅" if change_pct < 0 else "⚠️"
-            })
-    
-    # Critical Resolution
-    if 'resolution' in data:
-        critical_2024 = df_res[df_res['Severity'] == 'Critical']['2024_Avg_Days'].values
-        critical_2025 = df_res[df_res['Severity'] == 'Critical']['2025_Avg_Days'].values
-        if len(critical_2024) > 0 and len(critical_2025) > 0:
-            change_pct = ((critical_2025[0]-critical_2024[0])/critical_2024[0]*100)
-            summary_metrics.append({
-                "Metric": "Critical Resolution (days)", 
-                "2024": f"{critical_2024[0]:.0f}", 
-                "2025": f"{critical_2025[0]:.0f}", 
-                "Change": f"{change_pct:+.1f}%", 
-                "Trend": "✅" if change_pct < 0 else "⚠️"
-            })
-    
-    # Average FRT
-    if 'frt' in data:
-        frt_2024_avg = data['frt']['2024_Avg_Hours'].mean()
-        frt_2025_avg = data['frt']['2025_Avg_Hours'].mean()
-        change_pct = ((frt_2025_avg-frt_2024_avg)/frt_2024_avg*100)
-        summary_metrics.append({
-            "Metric": "Avg FRT (hours)", 
-            "2024": f"{frt_2024_avg:.0f}", 
-            "2025": f"{frt_2025_avg:.0f}", 
-            "Change": f"{change_pct:+.1f}%", 
-            "Trend": "✅" if change_pct < 0 else "⚠️"
-        })
-    
-    # Average Resolution
-    if 'resolution' in data:
-        avg_res_2024 = data['resolution']['2024_Avg_Days'].mean()
-        avg_res_2025 = data['resolution']['2025_Avg_Days'].mean()
-        change_pct = ((avg_res_2025-avg_res_2024)/avg_res_2024*100)
-        summary_metrics.append({
-            "Metric": "Avg Resolution (days)", 
-            "2024": f"{avg_res_2024:.0f}", 
-            "2025": f"{avg_res_2025:.0f}", 
-            "Change": f"{change_pct:+.1f}%", 
-            "Trend": "✅" if change_pct < 0 else "⚠️"
-        })
-    
-    if summary_metrics:
-        st.dataframe(pd.DataFrame(summary_metrics), width="stretch", hide_index=True)
+    # (Metric, 2024 value, 2025 value, value format, change unit), reusing the values computed above
+    summary_rows = []
+    if monthly is not None:
+        summary_rows.append(("Total Tickets", total_2024, total_2025, "{:,}", "%"))
+    if eng_summary is not None:
+        summary_rows.append(("Engineering Involvement", eng_rate['2024_Value_num'], eng_rate['2025_Value_num'], "{:.1f}%", "pp"))
+    if resolution is not None:
+        for severity in ['Blocker', 'Critical']:
+            if res_by_sev.loc[severity].notna().all():
+                summary_rows.append((
+                    f"{severity} Resolution (days)",
+                    res_by_sev.at[severity, '2024_Avg_Days'],
+                    res_by_sev.at[severity, '2025_Avg_Days'],
+                    "{:.0f}",
+                    "%"
+                ))
+    if frt is not None:
+        summary_rows.append(("Avg FRT (hours)", frt_2024_avg, frt_2025_avg, "{:.0f}", "%"))
+    if resolution is not None:
+        summary_rows.append(("Avg Resolution (days)", avg_res_2024, avg_res_2025, "{:.0f}", "%"))
+    
+    if summary_rows:
+        labels, values_2024, values_2025, fmts, units = zip(*summary_rows)
+        v24 = np.array(values_2024, dtype=float)
+        v25 = np.array(values_2025, dtype=float)
+        
+        # Percentage points are a plain difference; everything else is a relative change
+        # (0 when there is no 2024 baseline), lower is better
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pct = np.where(v24 != 0, (v25 - v24) / v24 * 100, 0.0)
+        changes = np.where(np.array(units) == "pp", v25 - v24, pct)
+        
+        summary_df = pd.DataFrame({
+            "Metric": labels,
+            "2024": [fmt.format(v) for fmt, v in zip(fmts, values_2024)],
+            "2025": [fmt.format(v) for fmt, v in zip(fmts, values_2025)],
+            "Change": [f"{change:+.1f}{unit}" for change, unit in zip(changes, units)],
+            "Trend": np.where(changes < 0, "✅", "⚠️")
+        }).astype(STRING_DTYPE)
+        st.dataframe(summary_df, width="stretch", hide_index=True)
     else:
         st.warning("No data available for comparison")
 
@@ -319,6 +190,8 @@ elif page == "👥 Team Scorecard":
         st.error("Team performance data not available. Please ensure CSV files are uploaded.")
         st.stop()
     
+    l1_sorted, l2_sorted = team_rankings(data['assignees'], data['contributors'])
+    
     # Side-by-side layout
     col_l1, col_l2 = st.columns(2)
     
@@ -332,39 +205,41 @@ elif page == "👥 Team Scorecard":
         """, unsafe_allow_html=True)
         
         # Level 1 Team Metrics
-        l1_agents = data['assignees'][data['assignees']['Support_Level'] == 'Level 1']
-        if not l1_agents.empty:
+        if not l1_sorted.empty:
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
-                avg_tickets = l1_agents['Tickets_Resolved'].mean()
+                avg_tickets = l1_sorted['Total_Resolved'].mean()
                 st.metric("Avg Tickets/Agent", f"{avg_tickets:.0f}")
             
             with col2:
-                avg_res_time = l1_agents['Avg_Resolution_Days'].mean()
+                avg_res_time = l1_sorted['Avg_Resolution_Days'].mean()
                 st.metric("Avg Resolution Time", f"{avg_res_time:.1f}d")
             
             with col3:
-                avg_res_rate = l1_agents['Resolution_Rate_Pct'].mean()
+                avg_res_rate = l1_sorted['Resolution_Rate_Pct'].mean()
                 st.metric("Avg Resolution Rate", f"{avg_res_rate:.1f}%")
             
             with col4:
-                avg_eng_esc = l1_agents['Engineering_Escalation_Rate_Pct'].mean()
+                avg_eng_esc = l1_sorted['Engineering_Rate_Pct'].mean()
                 st.metric("Avg Eng Escalation", f"{avg_eng_esc:.1f}%")
             
             # Individual Rankings
             st.subheader("Individual Rankings")
-            l1_sorted = l1_agents.sort_values('Tickets_Resolved', ascending=False)
             
-            for idx, row in l1_sorted.iterrows():
-                with st.expander(f"{row['Assignee']} - {row['Tickets_Resolved']} tickets"):
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Resolution Rate", f"{row['Resolution_Rate_Pct']:.1f}%")
-                    with col2:
-                        st.metric("Avg Resolution", f"{row['Avg_Resolution_Days']:.1f}d")
-                    with col3:
-                        st.metric("Eng Escalation", f"{row['Engineering_Escalation_Rate_Pct']:.1f}%")
+            st.dataframe(
+                l1_sorted[['Year', 'Assignee', 'Total_Resolved', 'Resolution_Rate_Pct', 'Avg_Resolution_Days', 'Engineering_Rate_Pct']],
+                width="stretch",
+                hide_index=True,
+                column_config={
+                    "Year": st.column_config.NumberColumn("Year", format="%d"),
+                    "Assignee": st.column_config.TextColumn("Agent"),
+                    "Total_Resolved": st.column_config.NumberColumn("Tickets", format="%d"),
+                    "Resolution_Rate_Pct": st.column_config.NumberColumn("Resolution Rate", format="%.1f%%"),
+                    "Avg_Resolution_Days": st.column_config.NumberColumn("Avg Resolution", format="%.1fd"),
+                    "Engineering_Rate_Pct": st.column_config.NumberColumn("Eng Escalation", format="%.1f%%")
+                }
+            )
         else:
             st.warning("No Level 1 agent data available")
     
@@ -378,42 +253,46 @@ elif page == "👥 Team Scorecard":
         """, unsafe_allow_html=True)
         
         # Level 2 Team Metrics
-        l2_contributors = data['contributors']
-        if not l2_contributors.empty:
+        if not l2_sorted.empty:
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
-                total_helped = l2_contributors['Tickets_Contributed'].sum()
+                total_helped = l2_sorted['Tickets_Contributed'].sum()
                 st.metric("Total Tickets Helped", f"{total_helped}")
             
             with col2:
-                total_comments = l2_contributors['Total_Comments'].sum()
+                total_comments = l2_sorted['Total_Comments'].sum()
                 st.metric("Total Comments", f"{total_comments}")
             
             with col3:
-                avg_comments = l2_contributors['Avg_Comments_Per_Ticket'].mean()
+                avg_comments = l2_sorted['Avg_Comments_Per_Ticket'].mean()
                 st.metric("Avg Comments/Ticket", f"{avg_comments:.1f}")
             
             with col4:
-                avg_velocity = l2_contributors['Avg_Velocity_Per_Day'].mean()
+                avg_velocity = l2_sorted['Comment_Velocity_Per_Day'].mean()
                 st.metric("Avg Velocity/Day", f"{avg_velocity:.1f}")
             
             # Individual Rankings
             st.subheader("Individual Rankings")
-            l2_sorted = l2_contributors.sort_values('Tickets_Contributed', ascending=False)
             
-            for idx, row in l2_sorted.iterrows():
-                with st.expander(f"{row['Contributor']} - {row['Tickets_Contributed']} tickets helped"):
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Total Comments", f"{row['Total_Comments']}")
-                    with col2:
-                        st.metric("Avg Comments/Ticket", f"{row['Avg_Comments_Per_Ticket']:.1f}")
-                    with col3:
-                        if 'Avg_Hold_Time_Hours' in row and pd.notna(row['Avg_Hold_Time_Hours']):
-                            st.metric("Avg Hold Time", f"{row['Avg_Hold_Time_Hours']:.1f}h")
-                        else:
-                            st.metric("Avg Hold Time", "N/A")
+            # Hold time is optional per contributor; with none recorded the column is left out entirely
+            l2_columns = ['Year', 'Contributor', 'Tickets_Contributed', 'Total_Comments', 'Avg_Comments_Per_Ticket']
+            if not l2_sorted['Avg_Hold_Time_Hours'].isna().all():
+                l2_columns.append('Avg_Hold_Time_Hours')
+            
+            st.dataframe(
+                l2_sorted[l2_columns],
+                width="stretch",
+                hide_index=True,
+                column_config={
+                    "Year": st.column_config.NumberColumn("Year", format="%d"),
+                    "Contributor": st.column_config.TextColumn("Contributor"),
+                    "Tickets_Contributed": st.column_config.NumberColumn("Tickets Helped", format="%d"),
+                    "Total_Comments": st.column_config.NumberColumn("Total Comments", format="%d"),
+                    "Avg_Comments_Per_Ticket": st.column_config.NumberColumn("Avg Comments/Ticket", format="%.1f"),
+                    "Avg_Hold_Time_Hours": st.column_config.NumberColumn("Avg Hold Time", format="%.1fh", help="Blank when no hold time was recorded")
+                }
+            )
         else:
             st.warning("No Level 2 contributor data available")
 
@@ -432,8 +311,7 @@ elif page == "🏢 Customer Intelligence":
     
     if not data['orgs'].empty:
         # Display top customers
-        top_customers = data['orgs'].head(10)
-        st.dataframe(top_customers, use_container_width=True)
+        st.dataframe(tables['orgs_top10'], width="stretch")
     else:
         st.warning("No customer data available")
 
@@ -451,7 +329,7 @@ elif page == "⚙️ Engineering Analysis":
     st.subheader("Engineering Involvement Summary")
     
     if not data['eng_summary'].empty:
-        st.dataframe(data['eng_summary'], use_container_width=True)
+        st.dataframe(tables['eng_summary'], width="stretch")
     else:
         st.warning("No engineering data available")
 
@@ -469,7 +347,7 @@ elif page == "📊 Resolution Analysis":
     st.subheader("Resolution Times by Severity")
     
     if not data['resolution'].empty:
-        st.dataframe(data['resolution'], use_container_width=True)
+        st.dataframe(tables['resolution'], width="stretch")
     else:
         st.warning("No resolution data available")
 